@@ -14,10 +14,16 @@ Usage:
 
 import argparse
 import asyncio
+import importlib.util
 import json
-import os
-from datetime import datetime
+import logging
+import re
+import sys
+import weakref
+from collections.abc import Iterator
+from datetime import datetime, timezone
 from typing import Literal
+from urllib.parse import urlparse
 
 import httpx
 from dotenv import load_dotenv
@@ -27,6 +33,15 @@ from pydantic import BaseModel, Field
 load_dotenv()
 
 from browser_use import Agent, Browser, ChatBrowserUse
+from polymarket_config import CONFIG
+from polymarket_json import json_dumps, json_loads, orjson
+
+try:
+	from browser_use import ChatOpenAI
+except ImportError:
+	ChatOpenAI = None
+
+logger = logging.getLogger(__name__)
 
 
 class PolymarketTradeData(BaseModel):
@@ -93,6 +108,69 @@ class PolymarketTradeData(BaseModel):
 	)
 
 
+_TRADE_DATA_FIELDS = frozenset(PolymarketTradeData.model_fields)
+_NUMBER = (int, float)
+# The extraction prompt says "use null" for unknowns, so even required strings can arrive as None
+_REQUIRED_STRINGS = ('market_id', 'market_url', 'market_title', 'collected_at')
+_OPTIONAL_STRINGS = (
+	'market_category', 'end_date', 'time_remaining', 'resolution',
+	'description', 'recent_activity', 'market_context',
+)
+
+
+def _is_well_formed(data: dict) -> bool:
+	"""Cheap check that data already satisfies PolymarketTradeData, so validation can be skipped."""
+	prices = data.get('current_prices')
+	return (
+		_TRADE_DATA_FIELDS <= data.keys()
+		and data['status'] in ('active', 'resolved', 'closed')
+		and all(isinstance(data[k], str) for k in _REQUIRED_STRINGS)
+		and all(isinstance(data[k], str) or data[k] is None for k in _OPTIONAL_STRINGS)
+		and isinstance(data['outcomes'], list)
+		and all(isinstance(o, str) for o in data['outcomes'])
+		and isinstance(prices, dict)
+		and all(isinstance(p, _NUMBER) for p in prices.values())
+		and all(isinstance(data[k], _NUMBER) or data[k] is None for k in ('total_volume', 'liquidity'))
+		and (isinstance(data['number_of_traders'], int) or data['number_of_traders'] is None)
+		and (isinstance(data['perplexity_research'], dict) or data['perplexity_research'] is None)
+	)
+
+
+PERPLEXITY_API_URL = 'https://api.perplexity.ai/chat/completions'
+
+# HTTP/2 lets concurrent Perplexity queries share one connection; httpx needs the optional h2 package for it
+_HTTP2_AVAILABLE = importlib.util.find_spec('h2') is not None
+
+# One pooled client per event loop: httpx connections are bound to the loop that
+# opened them, and the collector runs on several loops across processes (the CLI's
+# asyncio.run, the Flask server's background loop, the FastAPI server's loop).
+_perplexity_clients: 'weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]' = (
+	weakref.WeakKeyDictionary()
+)
+
+
+def _get_perplexity_client() -> httpx.AsyncClient:
+	"""Return the pooled Perplexity client for the running event loop, creating it on first use."""
+	loop = asyncio.get_running_loop()
+	client = _perplexity_clients.get(loop)
+	if client is None or client.is_closed:
+		client = httpx.AsyncClient(
+			http2=_HTTP2_AVAILABLE,
+			timeout=30.0,
+			limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+			headers={'Content-Type': 'application/json'},
+		)
+		_perplexity_clients[loop] = client
+	return client
+
+
+async def close_perplexity_client() -> None:
+	"""Close the pooled Perplexity client for the running event loop, if any."""
+	client = _perplexity_clients.pop(asyncio.get_running_loop(), None)
+	if client is not None:
+		await client.aclose()
+
+
 async def query_perplexity(query: str, api_key: str | None = None) -> dict:
 	"""
 	Query Perplexity API for additional context about the market.
@@ -105,138 +183,74 @@ async def query_perplexity(query: str, api_key: str | None = None) -> dict:
 		dict: Perplexity search results
 	"""
 	if not api_key:
-		api_key = os.getenv('PERPLEXITY_API_KEY')
+		api_key = CONFIG.perplexity_api_key
 	
-	if not api_key or api_key == 'your_perplexity_api_key_here':
-		print('⚠️  Warning: PERPLEXITY_API_KEY not set. Skipping Perplexity research.')
+	if not api_key:
+		logger.warning('⚠️  Warning: PERPLEXITY_API_KEY not set. Skipping Perplexity research.')
 		return {}
 	
 	try:
-		async with httpx.AsyncClient(timeout=30.0) as client:
-			headers = {
-				'Authorization': f'Bearer {api_key}',
-				'Content-Type': 'application/json',
-			}
+		payload = {
+			'model': 'llama-3.1-sonar-large-128k-online',
+			'messages': [
+				{
+					'role': 'user',
+					'content': query
+				}
+			],
+			'temperature': 0.2,
+			'max_tokens': 2000,
+		}
+		
+		response = await _get_perplexity_client().post(
+			PERPLEXITY_API_URL,
+			json=payload,
+			headers={'Authorization': f'Bearer {api_key}'},
+		)
+		
+		if response.status_code == 200:
+			result = response.json()
+			content = result.get('choices', [{}])[0].get('message', {}).get('content', '')
+			citations = result.get('citations', [])
 			
-			payload = {
-				'model': 'llama-3.1-sonar-large-128k-online',
-				'messages': [
-					{
-						'role': 'user',
-						'content': query
-					}
-				],
-				'temperature': 0.2,
-				'max_tokens': 2000,
+			return {
+				'content': content,
+				'citations': citations,
+				'model': result.get('model', ''),
 			}
-			
-			response = await client.post(
-				'https://api.perplexity.ai/chat/completions',
-				json=payload,
-				headers=headers,
-			)
-			
-			if response.status_code == 200:
-				result = response.json()
-				content = result.get('choices', [{}])[0].get('message', {}).get('content', '')
-				citations = result.get('citations', [])
-				
-				return {
-					'content': content,
-					'citations': citations,
-					'model': result.get('model', ''),
-				}
-			else:
-				print(f'⚠️  Perplexity API error: {response.status_code} - {response.text}')
-				return {}
+		else:
+			logger.warning('⚠️  Perplexity API error: %s - %s', response.status_code, response.text)
+			return {}
 	except Exception as e:
-		print(f'⚠️  Perplexity API error: {e}')
+		logger.warning('⚠️  Perplexity API error: %s', e)
 		return {}
 
 
-async def collect_market_data(
-	market_identifier: str,
-	method: Literal['url', 'id', 'search'] = 'url',
-	headless: bool = True,
-	llm_model: str | None = None,
-) -> PolymarketTradeData:
-	"""
-	Collect structured data about a Polymarket trade/market.
-	
-	Args:
-		market_identifier: URL, market ID, or search query
-		method: How to find the market ('url', 'id', or 'search')
-		headless: Run browser in headless mode
-		llm_model: LLM model to use (default: ChatBrowserUse)
-		
-	Returns:
-		PolymarketTradeData: Structured data about the market
-	"""
-	
-	# Validate API key
-	api_key = os.getenv('BROWSER_USE_API_KEY')
-	if not api_key or api_key == 'your_api_key_here':
-		raise ValueError(
-			'BROWSER_USE_API_KEY not set. Get one from: https://cloud.browser-use.com/new-api-key'
-		)
-	
-	# Initialize LLM
-	if llm_model:
-		from browser_use import ChatOpenAI
-		llm = ChatOpenAI(model=llm_model)
-	else:
-		llm = ChatBrowserUse()
-	
-	# Build task prompt based on method
+PERPLEXITY_CONTEXT_PROMPT = 'Provide latest news, analysis, and context about: {topic}'
+
+_WORD_RE = re.compile(r'[a-z0-9]+')
+
+
+def topic_from_identifier(market_identifier: str, method: Literal['url', 'id', 'search']) -> str | None:
+	"""Derive a readable topic from the user's input so research can start before the market is scraped."""
+	if method == 'search':
+		return market_identifier.strip() or None
 	if method == 'url':
-		url = market_identifier
-		if not url.startswith('http'):
-			url = f'https://polymarket.com{market_identifier}'
-		prompt = f"""Navigate to {url} and extract all market data.
+		slug = urlparse(market_identifier).path.rstrip('/').rsplit('/', 1)[-1]
+		return slug.replace('-', ' ').strip() or None
+	return None
 
-Extract the following information:
-1. Market ID and URL
-2. Market title/question
-3. Category/type
-4. All possible outcomes/options
-5. Current price (probability) for each outcome as decimal (0-1)
-6. Total trading volume in USD
-7. Current liquidity in USD
-8. Number of traders
-9. Resolution/end date
-10. Time remaining until resolution
-11. Market status (active/resolved/closed)
-12. Resolution outcome if resolved
-13. Market description/context
-14. Recent trading activity
 
-When done, call the done action with success=True and put ALL extracted data in the text field as valid JSON matching this exact structure:
-{{
-  "market_id": "...",
-  "market_url": "...",
-  "market_title": "...",
-  "market_category": "...",
-  "outcomes": ["option1", "option2"],
-  "current_prices": {{"option1": 0.65, "option2": 0.35}},
-  "total_volume": 12345.67,
-  "liquidity": 5678.90,
-  "number_of_traders": 1234,
-  "end_date": "...",
-  "time_remaining": "...",
-  "status": "active|resolved|closed",
-  "resolution": "...",
-  "description": "...",
-  "recent_activity": "...",
-  "collected_at": "{datetime.now().isoformat()}"
-}}
+def topics_match(seed_topic: str, market_title: str) -> bool:
+	"""Whether research on seed_topic is still relevant to the market title the agent actually found."""
+	seed_words = set(_WORD_RE.findall(seed_topic.lower()))
+	if not seed_words:
+		return False
+	title_words = set(_WORD_RE.findall(market_title.lower()))
+	return len(seed_words & title_words) / len(seed_words) >= 0.5
 
-Extract prices as decimals between 0 and 1 (e.g., 0.65 means 65% probability).
-If a field is not available, use null."""
-	
-	elif method == 'id':
-		prompt = f"""Navigate to https://polymarket.com/event/{market_identifier} and extract all market data.
 
-Extract the following information:
+_PROMPT_TMPL = """{header}
 1. Market ID and URL
 2. Market title/question
 3. Category/type
@@ -269,54 +283,96 @@ When done, call the done action with success=True and put ALL extracted data in
   "resolution": "...",
   "description": "...",
   "recent_activity": "...",
-  "collected_at": "{datetime.now().isoformat()}"
+  "collected_at": "{ts}"
 }}
 
 Extract prices as decimals between 0 and 1 (e.g., 0.65 means 65% probability).
 If a field is not available, use null."""
-	
-	else:  # search
-		prompt = f"""Navigate to https://polymarket.com and search for: "{market_identifier}"
 
-Find the most relevant market from search results and navigate to it.
-Extract all market data including:
-1. Market ID and URL
-2. Market title/question
-3. Category/type
-4. All possible outcomes/options
-5. Current price (probability) for each outcome as decimal (0-1)
-6. Total trading volume in USD
-7. Current liquidity in USD
-8. Number of traders
-9. Resolution/end date
-10. Time remaining until resolution
-11. Market status (active/resolved/closed)
-12. Resolution outcome if resolved
-13. Market description/context
-14. Recent trading activity
+_JSON_DECODER = json.JSONDecoder()
 
-When done, call the done action with success=True and put ALL extracted data in the text field as valid JSON matching this exact structure:
-{{
-  "market_id": "...",
-  "market_url": "...",
-  "market_title": "...",
-  "market_category": "...",
-  "outcomes": ["option1", "option2"],
-  "current_prices": {{"option1": 0.65, "option2": 0.35}},
-  "total_volume": 12345.67,
-  "liquidity": 5678.90,
-  "number_of_traders": 1234,
-  "end_date": "...",
-  "time_remaining": "...",
-  "status": "active|resolved|closed",
-  "resolution": "...",
-  "description": "...",
-  "recent_activity": "...",
-  "collected_at": "{datetime.now().isoformat()}"
-}}
+# Payload inside <json>...</json>, or after a leading ```/```json fence (closing fence optional)
+_JSON_FENCE_RE = re.compile(r'<json>(.*?)</json>|^```(?:json)?(.*?)(?:```)?\s*$', re.DOTALL | re.IGNORECASE)
 
-Extract prices as decimals between 0 and 1 (e.g., 0.65 means 65% probability).
-If a field is not available, use null."""
+
+def _decode_first_object(text: str) -> dict:
+	"""Decode the first JSON object in text, ignoring any prose before or after it."""
+	start = text.find('{')
+	if start == -1:
+		raise json.JSONDecodeError('No JSON object found', text, 0)
+	if orjson is not None:
+		# Fast path for the common case where nothing trails the object
+		try:
+			return orjson.loads(text[start:])
+		except orjson.JSONDecodeError:
+			pass
+	# A stray '{' in leading prose must not hide the real object: hop to the
+	# next candidate brace with str.find (a C-level scan) and retry
+	first_error = None
+	while start != -1:
+		try:
+			data, _ = _JSON_DECODER.raw_decode(text, start)
+			return data
+		except json.JSONDecodeError as e:
+			first_error = first_error or e
+			start = text.find('{', start + 1)
+	raise first_error
+
+
+async def collect_market_data(
+	market_identifier: str,
+	method: Literal['url', 'id', 'search'] = 'url',
+	headless: bool = True,
+	llm_model: str | None = None,
+) -> PolymarketTradeData:
+	"""
+	Collect structured data about a Polymarket trade/market.
+	
+	Args:
+		market_identifier: URL, market ID, or search query
+		method: How to find the market ('url', 'id', or 'search')
+		headless: Run browser in headless mode
+		llm_model: LLM model to use (default: ChatBrowserUse)
+		
+	Returns:
+		PolymarketTradeData: Structured data about the market
+	"""
+	
+	# One timestamp for both the prompt and the stored record
+	ts = datetime.now(timezone.utc).isoformat()
+	
+	# Validate API key
+	if not CONFIG.browser_use_api_key:
+		raise ValueError(
+			'BROWSER_USE_API_KEY not set. Get one from: https://cloud.browser-use.com/new-api-key'
+		)
+	
+	# Initialize LLM
+	if llm_model:
+		if ChatOpenAI is None:
+			raise ValueError(f'LLM model {llm_model!r} requested but ChatOpenAI is unavailable. Install with: pip install openai')
+		llm = ChatOpenAI(model=llm_model)
+	else:
+		llm = ChatBrowserUse()
+	
+	# Build task prompt based on method
+	if method == 'url':
+		url = market_identifier
+		if not url.startswith('http'):
+			url = f'https://polymarket.com{market_identifier}'
+		header = f'Navigate to {url} and extract all market data.\n\nExtract the following information:'
+	elif method == 'id':
+		header = (
+			f'Navigate to https://polymarket.com/event/{market_identifier} and extract all market data.\n\n'
+			'Extract the following information:'
+		)
+	else:  # search
+		header = (
+			f'Navigate to https://polymarket.com and search for: "{market_identifier}"\n\n'
+			'Find the most relevant market from search results and navigate to it.\n'
+			'Extract all market data including:'
+		)
+	prompt = _PROMPT_TMPL.format(header=header, ts=ts)
 	
 	# Initialize browser and agent
 	browser = Browser(headless=headless)
@@ -327,13 +383,18 @@ If a field is not available, use null."""
 		use_vision='auto',
 	)
 	
-	print(f'🔍 Collecting Polymarket data...')
-	print(f'   Method: {method}')
-	print(f'   Identifier: {market_identifier}')
-	print('-' * 60)
+	logger.info('🔍 Collecting Polymarket data...\n   Method: %s\n   Identifier: %s\n%s', method, market_identifier, '-' * 60)
 	
-	# Run agent
-	result = await agent.run(max_steps=50)
+	# Run agent, researching the requested topic on Perplexity at the same time
+	seed_topic = topic_from_identifier(market_identifier, method)
+	perplexity_data = {}
+	if seed_topic:
+		result, perplexity_data = await asyncio.gather(
+			agent.run(max_steps=50),
+			query_perplexity(PERPLEXITY_CONTEXT_PROMPT.format(topic=seed_topic)),
+		)
+	else:
+		result = await agent.run(max_steps=50)
 	
 	# Extract JSON from result
 	raw_result = result.final_result() if result else None
@@ -344,20 +405,10 @@ If a field is not available, use null."""
 	# Parse JSON from result
 	text = str(raw_result).strip()
 	
-	# Clean up JSON extraction (handle various formats)
-	if '<json>' in text and '</json>' in text:
-		text = text.split('<json>', 1)[1].split('</json>', 1)[0].strip()
-	
-	if text.startswith('```'):
-		text = text.lstrip('`\n ').strip()
-		if text.lower().startswith('json'):
-			text = text[4:].lstrip()
-		text = text.rstrip('`').strip()
-	
-	# Find first JSON object
-	brace = text.find('{')
-	if brace != -1:
-		text = text[brace:]
+	# Clean up JSON extraction (<json> tags or a leading ``` fence) in one regex pass
+	fence = _JSON_FENCE_RE.search(text)
+	if fence:
+		text = (fence.group(1) if fence.group(1) is not None else fence.group(2)).strip()
 	
 	try:
 		# First, try to decode escaped characters (like \n) that might be in the string
@@ -365,131 +416,137 @@ If a field is not available, use null."""
 		try:
 			# Try to decode as if it's a JSON string literal (removes escaping)
 			text_decoded = text.encode('utf-8').decode('unicode_escape')
-			data = json.loads(text_decoded)
+			data = _decode_first_object(text_decoded)
 		except (json.JSONDecodeError, UnicodeDecodeError):
 			# If that fails, try parsing the original text
-			data = json.loads(text)
+			data = _decode_first_object(text)
 	except json.JSONDecodeError as e:
-		# Try to extract just the JSON portion
-		brace_count = 0
-		start_idx = None
-		end_idx = None
-		
-		for i, char in enumerate(text):
-			if char == '{':
-				if brace_count == 0:
-					start_idx = i
-				brace_count += 1
-			elif char == '}':
-				brace_count -= 1
-				if brace_count == 0 and start_idx is not None:
-					end_idx = i + 1
-					break
-		
-		if start_idx is not None and end_idx is not None:
-			try:
-				# Try decoding the extracted portion too
-				extracted = text[start_idx:end_idx]
-				try:
-					extracted_decoded = extracted.encode('utf-8').decode('unicode_escape')
-					data = json.loads(extracted_decoded)
-				except (json.JSONDecodeError, UnicodeDecodeError):
-					data = json.loads(extracted)
-			except json.JSONDecodeError:
-				raise ValueError(f'Could not parse JSON from result: {e}')
-		else:
-			raise ValueError(f'Could not parse JSON from result: {e}')	# Collect additional context from Perplexity
-	perplexity_data = {}
+		raise ValueError(f'Could not parse JSON from result: {e}')
+	
+	# Collect additional context from Perplexity, re-querying only if the
+	# speculative research was about a different topic than the market found.
+	# Resolved/closed markets can't be traded, so research adds nothing there.
 	market_context = None
+	market_title = data.get('market_title')
+	is_active = data.get('status') == 'active'
 	
-	if data.get('market_title'):
-		print('\n🔍 Querying Perplexity for additional context...')
-		perplexity_query = f"Provide latest news, analysis, and context about: {data.get('market_title')}"
-		perplexity_data = await query_perplexity(perplexity_query)
-		
-		if perplexity_data and perplexity_data.get('content'):
-			market_context = perplexity_data.get('content')
-			print('✓ Perplexity research completed')
+	if market_title and is_active and not (seed_topic and topics_match(seed_topic, market_title)):
+		logger.info('\n🔍 Querying Perplexity for additional context...')
+		perplexity_data = await query_perplexity(PERPLEXITY_CONTEXT_PROMPT.format(topic=market_title))
+	
+	if perplexity_data and perplexity_data.get('content'):
+		market_context = perplexity_data.get('content')
+		logger.info('✓ Perplexity research completed')
 	
 	# Add Perplexity data to market data
 	data['perplexity_research'] = perplexity_data
 	data['market_context'] = market_context
 	
 	# Validate and add timestamp
-	if 'collected_at' not in data or not data['collected_at']:
-		data['collected_at'] = datetime.now().isoformat()
+	data['collected_at'] = data.get('collected_at') or ts
 	
-	# Convert to Pydantic model for validation
-	trade_data = PolymarketTradeData(**data)
+	# Convert to Pydantic model; skip field validation when the shape is already right,
+	# and fall back to full validation otherwise so errors are still reported
+	if _is_well_formed(data):
+		trade_data = PolymarketTradeData.model_construct(**data)
+	else:
+		trade_data = PolymarketTradeData(**data)
 	
 	return trade_data
 
 
 async def save_data(
-	data: PolymarketTradeData,
-	output_file: str = 'polymarket_data.json',
+	data: PolymarketTradeData | dict,
+	output_file: str = 'polymarket_data.jsonl',
 ):
-	"""Save collected data to JSON file."""
-	data_dict = data.model_dump()
-	
-	# Append to file or create new
-	existing_data = []
-	if os.path.exists(output_file):
-		try:
-			with open(output_file, 'r') as f:
-				existing_data = json.load(f)
-		except Exception:
-			existing_data = []
+	"""Append collected data (a model or an already-dumped dict) to a JSON Lines file."""
+	data_dict = data if isinstance(data, dict) else data.model_dump()
+	with open(output_file, 'a', encoding='utf-8') as f:
+		f.write(json_dumps(data_dict) + '\n')
 	
-	existing_data.append(data_dict)
-	
-	with open(output_file, 'w') as f:
-		json.dump(existing_data, f, indent=2, ensure_ascii=False)
-	
-	print(f'\n💾 Data saved to: {output_file}')
+	logger.info('\n💾 Data saved to: %s', output_file)
 
 
-def display_data(data: PolymarketTradeData):
-	"""Display collected data in a readable format."""
-	print('\n' + '=' * 60)
-	print('📊 POLYMARKET DATA COLLECTED')
-	print('=' * 60)
-	print(f'\n🎯 Market: {data.market_title}')
-	print(f'🔗 URL: {data.market_url}')
-	print(f'📁 Category: {data.market_category or "N/A"}')
-	print(f'🏷️  Status: {data.status.upper()}')
-	print(f'🆔 Market ID: {data.market_id}')
-	
-	if data.description:
-		print(f'\n📝 Description: {data.description[:200]}...' if len(data.description) > 200 else f'\n📝 Description: {data.description}')
+def load_history(input_file: str = 'polymarket_data.jsonl') -> Iterator[dict]:
+	"""Yield previously collected market records from a JSON Lines file, oldest first."""
+	with open(input_file, 'r', encoding='utf-8') as f:
+		for line in f:
+			if line.strip():
+				yield json_loads(line)
+
+
+def find_in_history(market_id: str, input_file: str = 'polymarket_data.jsonl') -> dict | None:
+	"""
+	Return the most recent record for market_id in a JSON Lines file, or None.
 	
-	print(f'\n💰 Market Stats:')
-	if data.total_volume:
-		print(f'   Total Volume: ${data.total_volume:,.2f}')
-	if data.liquidity:
-		print(f'   Liquidity: ${data.liquidity:,.2f}')
-	if data.number_of_traders:
-		print(f'   Traders: {data.number_of_traders:,}')
+	Lines are only decoded when they contain the JSON-encoded id, so a lookup
+	reads the file once instead of parsing every record in it.
+	"""
+	needle = json_dumps(market_id)
+	match = None
+	with open(input_file, 'r', encoding='utf-8') as f:
+		for line in f:
+			if needle in line:
+				record = json_loads(line)
+				if record.get('market_id') == market_id:
+					match = record
+	return match
+
+
+def _truncate(text: str, limit: int = 200) -> str:
+	"""Shorten text to limit characters, marking the cut with an ellipsis."""
+	return f'{text[:limit]}...' if len(text) > limit else text
+
+
+def display_data(data: PolymarketTradeData | dict):
+	"""Display collected data (a model or a dumped dict) in a readable format."""
+	# Pydantic keeps field values in the instance __dict__: plain dict lookups, no copy
+	d = data if isinstance(data, dict) else data.__dict__
+	parts = [
+		'\n' + '=' * 60,
+		'📊 POLYMARKET DATA COLLECTED',
+		'=' * 60,
+		f'\n🎯 Market: {d["market_title"]}',
+		f'🔗 URL: {d["market_url"]}',
+		f'📁 Category: {d.get("market_category") or "N/A"}',
+		f'🏷️  Status: {d["status"].upper()}',
+		f'🆔 Market ID: {d["market_id"]}',
+	]
+	
+	if description := d.get('description'):
+		parts.append(f'\n📝 Description: {_truncate(description)}')
+	
+	parts.append('\n💰 Market Stats:')
+	if total_volume := d.get('total_volume'):
+		parts.append(f'   Total Volume: ${total_volume:,.2f}')
+	if liquidity := d.get('liquidity'):
+		parts.append(f'   Liquidity: ${liquidity:,.2f}')
+	if number_of_traders := d.get('number_of_traders'):
+		parts.append(f'   Traders: {number_of_traders:,}')
+	
+	parts.append('\n🎲 Outcomes & Current Prices:')
+	current_prices = d['current_prices']
+	parts.extend(
+		f'   • {outcome}: {(price := current_prices.get(outcome, 0.0)):.4f} ({price * 100:.2f}%)'
+		for outcome in d['outcomes']
+	)
 	
-	print(f'\n🎲 Outcomes & Current Prices:')
-	for outcome in data.outcomes:
-		price = data.current_prices.get(outcome, 0)
-		percentage = price * 100
-		print(f'   • {outcome}: {price:.4f} ({percentage:.2f}%)')
+	if end_date := d.get('end_date'):
+		parts.append(f'\n📅 End Date: {end_date}')
+	if time_remaining := d.get('time_remaining'):
+		parts.append(f'⏱️  Time Remaining: {time_remaining}')
 	
-	if data.end_date:
-		print(f'\n📅 End Date: {data.end_date}')
-	if data.time_remaining:
-		print(f'⏱️  Time Remaining: {data.time_remaining}')
+	if d['status'] == 'resolved' and d.get('resolution'):
+		parts.append(f'\n✅ Resolution: {d["resolution"]}')
 	
-	if data.status == 'resolved' and data.resolution:
-		print(f'\n✅ Resolution: {data.resolution}')
+	if recent_activity := d.get('recent_activity'):
+		parts.append(f'\n📈 Recent Activity: {_truncate(recent_activity)}')
 	
-	if data.recent_activity:
-		print(f'\n📈 Recent Activity: {data.recent_activity[:200]}...' if len(data.recent_activity) > 200 else f'\n📈 Recent Activity: {data.recent_activity}')
+	parts.append(f'\n🕐 Collected At: {d["collected_at"]}')
+	parts.append('=' * 60)
 	
-	print(f'\n🕐 Collected At: {data.collected_at}')
-	print('=' * 60)
+	# One write instead of a print() per line
+	sys.stdout.write('\n'.join(parts) + '\n')
 
 
 async def main():
@@ -515,8 +572,8 @@ async def main():
 	parser.add_argument(
 		'--output',
 		type=str,
-		default='polymarket_data.json',
-		help='Output JSON file path',
+		default='polymarket_data.jsonl',
+		help='Output JSON Lines file path (records are appended)',
 	)
 	parser.add_argument(
 		'--headless',
@@ -556,21 +613,23 @@ async def main():
 		# Display results
 		display_data(data)
 		
-		# Save to file
-		await save_data(data, args.output)
+		# Save to file (dump the model once for both the file and the printout)
+		data_dict = data.model_dump()
+		await save_data(data_dict, args.output)
 		
 		# Print JSON for programmatic use
 		print('\n📋 JSON Output (for use by decision agent):')
-		print(json.dumps(data.model_dump(), indent=2, ensure_ascii=False))
+		print(json_dumps(data_dict, indent=True))
 		
 	except Exception as e:
-		print(f'\n❌ Error: {e}')
-		import traceback
-		if args.headless:
-			traceback.print_exc()
+		logger.error('\n❌ Error: %s', e, exc_info=args.headless)
 		raise
+	finally:
+		await close_perplexity_client()
 
 
 if __name__ == '__main__':
+	# Progress messages from the library functions go through logging
+	logging.basicConfig(level=logging.INFO, format='%(message)s')
 	asyncio.run(main())
 
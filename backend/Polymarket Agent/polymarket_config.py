@@ -0,0 +1,50 @@
+"""
+Polymarket Agent configuration
+
+API keys are read from the environment (and .env) once at import time, so the
+collector and decision agent share one snapshot instead of calling os.getenv
+on every request. Placeholder values copied from the example env files are
+treated as unset.
+"""
+
+import os
+from dataclasses import dataclass
+
+from dotenv import load_dotenv
+
+# Load environment variables
+load_dotenv()
+
+_PLACEHOLDERS = frozenset({
+	'your_api_key_here',
+	'your_bu_api_key_here',
+	'your_perplexity_api_key_here',
+	'your_hyperspell_api_key_here',
+	'your_replit_api_key_here',
+})
+
+
+def _env_key(name: str) -> str | None:
+	"""Read an API key from the environment, returning None if unset or a placeholder."""
+	value = os.getenv(name)
+	if not value or value in _PLACEHOLDERS:
+		return None
+	return value
+
+
+@dataclass(frozen=True, slots=True)
+class Config:
+	"""API keys used by the Polymarket agents."""
+
+	perplexity_api_key: str | None
+	browser_use_api_key: str | None
+	hyperspell_api_key: str | None
+	replit_api_key: str | None
+
+
+CONFIG = Config(
+	perplexity_api_key=_env_key('PERPLEXITY_API_KEY'),
+	browser_use_api_key=_env_key('BROWSER_USE_API_KEY'),
+	hyperspell_api_key=_env_key('HYPERSPELL_API_KEY'),
+	replit_api_key=_env_key('REPLIT_API_KEY'),
+)
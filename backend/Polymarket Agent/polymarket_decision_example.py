@@ -19,8 +19,10 @@ For Hyperspell learning:
 """
 
 import argparse
-import json
-import os
+import asyncio
+import functools
+import logging
+import re
 from datetime import datetime
 from typing import Literal
 
@@ -31,13 +33,46 @@ from pydantic import BaseModel, Field
 # Load environment variables
 load_dotenv()
 
+from polymarket_config import CONFIG
+from polymarket_json import json_dumps, json_loads
+
+logger = logging.getLogger(__name__)
+
 # Import Hyperspell
 try:
 	from hyperspell import Hyperspell
 	HYPERSPELL_AVAILABLE = True
 except ImportError:
 	HYPERSPELL_AVAILABLE = False
-	print('⚠️  Hyperspell not installed. Install with: pip install hyperspell')
+	logger.warning('⚠️  Hyperspell not installed. Install with: pip install hyperspell')
+
+# numpy is optional; only used for markets with many outcomes
+try:
+	import numpy as np
+	NUMPY_AVAILABLE = True
+except ImportError:
+	NUMPY_AVAILABLE = False
+
+# Below this many outcomes, building arrays costs more than min()/max() over the dict
+_NUMPY_MIN_OUTCOMES = 32
+
+# Insight tag -> note appended to learning_insights; the keys are the complete tag vocabulary
+_INSIGHT_NOTES = {
+	'profitable': "Similar markets have been profitable. ",
+	'poor': "Caution: Similar markets have had poor results. ",
+}
+
+# Buy threshold per insight tag, as (threshold, fallback): the threshold applies when the
+# lowest price is already below it, otherwise the fallback does. Profitable history
+# widens the window; poor history demands a stronger signal.
+_BUY_THRESHOLDS = {
+	'profitable': (0.35, 0.3),
+	'poor': (0.25, 0.3),
+	None: (0.3, 0.3),
+}
+
+# Matches the outcome line written by to_memory_text / update_decision_outcome
+_RESULT_RE = re.compile(r'^Result: (CORRECT|INCORRECT)$', re.MULTILINE)
 
 
 class BettingDecision(BaseModel):
@@ -88,35 +123,37 @@ class DecisionOutcome(BaseModel):
 	
 	def to_memory_text(self) -> str:
 		"""Convert to text format for Hyperspell storage."""
-		result = f"Decision on market {self.market_id}:\n"
-		result += f"Market: {self.market_data.get('market_title', 'N/A')}\n"
-		result += f"Decision: {self.decision_made.get('decision', 'N/A')}\n"
-		result += f"Outcome: {self.decision_made.get('outcome', 'N/A')}\n"
-		result += f"Confidence: {self.decision_made.get('confidence', 0)}\n"
-		result += f"Reasoning: {self.decision_made.get('reasoning', 'N/A')}\n"
+		lines = [
+			f"Decision on market {self.market_id}:",
+			f"Market: {self.market_data.get('market_title', 'N/A')}",
+			f"Decision: {self.decision_made.get('decision', 'N/A')}",
+			f"Outcome: {self.decision_made.get('outcome', 'N/A')}",
+			f"Confidence: {self.decision_made.get('confidence', 0)}",
+			f"Reasoning: {self.decision_made.get('reasoning', 'N/A')}",
+		]
 		
 		if self.outcome_known:
-			result += f"Result: {'CORRECT' if self.was_correct else 'INCORRECT'}\n"
-			result += f"Actual Outcome: {self.outcome_result}\n"
+			lines.append(f"Result: {'CORRECT' if self.was_correct else 'INCORRECT'}")
+			lines.append(f"Actual Outcome: {self.outcome_result}")
 			if self.actual_return is not None:
-				result += f"Return: {self.actual_return}%\n"
+				lines.append(f"Return: {self.actual_return}%")
 		
-		return result
+		return '\n'.join(lines) + '\n'
 
 
+@functools.lru_cache(maxsize=1)
 def get_hyperspell_client() -> 'Hyperspell | None':
-	"""Get Hyperspell client if available."""
+	"""Get Hyperspell client if available (created once and reused, so its HTTP session is shared)."""
 	if not HYPERSPELL_AVAILABLE:
 		return None
 	
-	api_key = os.getenv('HYPERSPELL_API_KEY')
-	if not api_key or api_key == 'your_hyperspell_api_key_here':
+	if not CONFIG.hyperspell_api_key:
 		return None
 	
 	try:
-		return Hyperspell(api_key=api_key)
+		return Hyperspell(api_key=CONFIG.hyperspell_api_key)
 	except Exception as e:
-		print(f'⚠️  Hyperspell initialization error: {e}')
+		logger.warning('⚠️  Hyperspell initialization error: %s', e)
 		return None
 
 
@@ -136,7 +173,7 @@ async def query_past_decisions(
 		limit: Maximum number of past decisions to retrieve
 		
 	Returns:
-		List of past decision documents
+		List of past decisions as {'text': str, 'score': float} dicts
 	"""
 	if not hyperspell_client:
 		return []
@@ -147,8 +184,9 @@ async def query_past_decisions(
 		if market_category:
 			query += f" in {market_category}"
 		
-		# Search for relevant past decisions
-		response = hyperspell_client.memories.search(
+		# Search for relevant past decisions (the SDK is synchronous, so keep it off the event loop)
+		response = await asyncio.to_thread(
+			hyperspell_client.memories.search,
 			query=query,
 			sources=["vault"],
 			options={"vault": {"collection": "betting_decisions"}},
@@ -161,7 +199,7 @@ async def query_past_decisions(
 				if hasattr(doc, 'text'):
 					past_decisions.append({
 						'text': doc.text,
-						'score': getattr(doc, 'score', 0.0) if hasattr(doc, 'score') else 0.0,
+						'score': getattr(doc, 'score', 0.0),
 					})
 		elif hasattr(response, 'data') and isinstance(response.data, list):
 			for item in response.data[:limit]:
@@ -172,7 +210,7 @@ async def query_past_decisions(
 		
 		return past_decisions
 	except Exception as e:
-		print(f'⚠️  Error querying Hyperspell: {e}')
+		logger.warning('⚠️  Error querying Hyperspell: %s', e)
 		return []
 
 
@@ -197,27 +235,30 @@ async def store_decision(
 	
 	try:
 		# Create memory text
-		memory_text = f"Betting decision on market {decision.market_id}:\n"
-		memory_text += f"Market: {market_data.get('market_title', 'N/A')}\n"
-		memory_text += f"Category: {market_data.get('market_category', 'N/A')}\n"
-		memory_text += f"Decision: {decision.decision}\n"
-		memory_text += f"Outcome: {decision.outcome or 'N/A'}\n"
-		memory_text += f"Confidence: {decision.confidence:.2%}\n"
-		memory_text += f"Reasoning: {decision.reasoning}\n"
-		memory_text += f"Risk: {decision.risk_assessment}\n"
-		memory_text += f"Value Opportunity: {decision.value_opportunity}\n"
-		memory_text += f"Prices: {market_data.get('current_prices', {})}\n"
-		memory_text += f"Timestamp: {datetime.now().isoformat()}\n"
+		memory_text = '\n'.join([
+			f"Betting decision on market {decision.market_id}:",
+			f"Market: {market_data.get('market_title', 'N/A')}",
+			f"Category: {market_data.get('market_category', 'N/A')}",
+			f"Decision: {decision.decision}",
+			f"Outcome: {decision.outcome or 'N/A'}",
+			f"Confidence: {decision.confidence:.2%}",
+			f"Reasoning: {decision.reasoning}",
+			f"Risk: {decision.risk_assessment}",
+			f"Value Opportunity: {decision.value_opportunity}",
+			f"Prices: {market_data.get('current_prices', {})}",
+			f"Timestamp: {datetime.now().isoformat()}",
+		]) + '\n'
 		
 		# Store in Hyperspell
-		result = hyperspell_client.memories.add(
+		result = await asyncio.to_thread(
+			hyperspell_client.memories.add,
 			text=memory_text,
 			collection="betting_decisions"
 		)
 		
 		return result is not None
 	except Exception as e:
-		print(f'⚠️  Error storing decision in Hyperspell: {e}')
+		logger.warning('⚠️  Error storing decision in Hyperspell: %s', e)
 		return False
 
 
@@ -246,22 +287,26 @@ async def update_decision_outcome(
 	
 	try:
 		# Create outcome update text
-		outcome_text = f"Decision outcome for {decision_id}:\n"
-		outcome_text += f"Result: {'CORRECT' if was_correct else 'INCORRECT'}\n"
-		outcome_text += f"Actual Outcome: {actual_outcome}\n"
+		lines = [
+			f"Decision outcome for {decision_id}:",
+			f"Result: {'CORRECT' if was_correct else 'INCORRECT'}",
+			f"Actual Outcome: {actual_outcome}",
+		]
 		if actual_return is not None:
-			outcome_text += f"Return: {actual_return}%\n"
-		outcome_text += f"Updated: {datetime.now().isoformat()}\n"
+			lines.append(f"Return: {actual_return}%")
+		lines.append(f"Updated: {datetime.now().isoformat()}")
+		outcome_text = '\n'.join(lines) + '\n'
 		
 		# Store outcome in separate collection for tracking
-		result = hyperspell_client.memories.add(
+		result = await asyncio.to_thread(
+			hyperspell_client.memories.add,
 			text=outcome_text,
 			collection="decision_outcomes"
 		)
 		
 		return result is not None
 	except Exception as e:
-		print(f'⚠️  Error updating decision outcome in Hyperspell: {e}')
+		logger.warning('⚠️  Error updating decision outcome in Hyperspell: %s', e)
 		return False
 
 
@@ -277,7 +322,7 @@ async def analyze_with_replit(data: dict, replit_api_key: str | None = None) ->
 		BettingDecision: Decision with reasoning
 	"""
 	if not replit_api_key:
-		replit_api_key = os.getenv('REPLIT_API_KEY')
+		replit_api_key = CONFIG.replit_api_key
 	
 	if not replit_api_key:
 		raise ValueError(
@@ -330,6 +375,9 @@ Return as JSON matching this structure:
 }}
 """
 	
+	# Initialize Hyperspell for learning (shared by the fallback paths below)
+	hyperspell_client = get_hyperspell_client()
+	
 	try:
 		# Use Replit's API (example - adjust based on actual Replit API)
 		# This is a placeholder - Replit may have different API endpoints
@@ -352,24 +400,49 @@ Return as JSON matching this structure:
 			
 			# Placeholder: Return the result from local analysis
 			# In production, you'd make actual Replit API calls here
-			print('⚠️  Using local analysis (Replit API integration pending)')
-			print('   To use Replit: Deploy this script to Replit and call it via HTTP')
+			logger.warning(
+				'⚠️  Using local analysis (Replit API integration pending)\n'
+				'   To use Replit: Deploy this script to Replit and call it via HTTP'
+			)
 			
 			# Fall back to local analysis for now
-			# Initialize Hyperspell for learning
-			hyperspell_client = get_hyperspell_client()
 			return await analyze_market_for_betting(data, hyperspell_client)
 			
 	except Exception as e:
-		print(f'⚠️  Replit API error: {e}')
-		print('   Falling back to local analysis...')
-		hyperspell_client = get_hyperspell_client()
+		logger.warning('⚠️  Replit API error: %s\n   Falling back to local analysis...', e)
 		return await analyze_market_for_betting(data, hyperspell_client)
 
 
+def _price_extremes(current_prices: dict[str, float]) -> tuple[str | None, float, str | None, float]:
+	"""
+	Find the lowest and highest priced outcomes.
+	
+	Args:
+		current_prices: Price per outcome
+		
+	Returns:
+		(lowest outcome, lowest price, highest outcome, highest price); ties go to
+		the first outcome, and an empty dict gives (None, 1.0, None, 0.0)
+	"""
+	if not current_prices:
+		return None, 1.0, None, 0.0
+	
+	if NUMPY_AVAILABLE and len(current_prices) >= _NUMPY_MIN_OUTCOMES:
+		# Multi-outcome markets: one contiguous array, reductions in numpy
+		outcomes = list(current_prices)
+		prices = np.fromiter(current_prices.values(), dtype=np.float64, count=len(outcomes))
+		lo, hi = int(prices.argmin()), int(prices.argmax())
+		return outcomes[lo], float(prices[lo]), outcomes[hi], float(prices[hi])
+	
+	lowest = min(current_prices, key=current_prices.get)
+	highest = max(current_prices, key=current_prices.get)
+	return lowest, current_prices[lowest], highest, current_prices[highest]
+
+
 async def analyze_market_for_betting(
 	data: dict,
 	hyperspell_client: 'Hyperspell | None' = None,
+	past_decisions: list[dict] | None = None,
 ) -> BettingDecision:
 	"""
 	Analyze collected Polymarket data and make a betting decision.
@@ -379,30 +452,57 @@ async def analyze_market_for_betting(
 	Args:
 		data: Market data from polymarket_collector.py
 		hyperspell_client: Hyperspell client for learning from past decisions
+		past_decisions: Results of query_past_decisions fetched ahead of time (e.g. while
+			the market was being collected); None queries Hyperspell here
 		
 	Returns:
 		BettingDecision: Decision with reasoning
 	"""
 	
+	market_id = data.get('market_id')
+	status = data.get('status', 'active')
+	
+	# Inactive markets can't be traded: decide before spending a Hyperspell round-trip
+	if status != 'active':
+		return BettingDecision(
+			market_id=market_id,
+			decision='no_action',
+			confidence=1.0,
+			reasoning=f"Market is {status}, cannot trade",
+			risk_assessment='high',
+			value_opportunity=False,
+		)
+	
 	# Query past similar decisions from Hyperspell
-	past_decisions = []
 	learning_insights = None
+	# A key of _INSIGHT_NOTES or None, tagged alongside learning_insights so the
+	# threshold and confidence blocks don't re-scan the text
+	insight = None
 	
 	if hyperspell_client:
 		try:
-			print('\n🧠 Querying Hyperspell for past decisions...')
-			past_decisions = await query_past_decisions(
-				hyperspell_client,
-				data.get('market_title', ''),
-				data.get('market_category'),
-				limit=5
-			)
+			if past_decisions is None:
+				logger.info('\n🧠 Querying Hyperspell for past decisions...')
+				past_decisions = await query_past_decisions(
+					hyperspell_client,
+					data.get('market_title', ''),
+					data.get('market_category'),
+					limit=5
+				)
 			
 			if past_decisions:
-				print(f'✓ Found {len(past_decisions)} relevant past decisions')
+				logger.info('✓ Found %d relevant past decisions', len(past_decisions))
 				# Extract insights from past decisions
-				correct_count = sum(1 for d in past_decisions if 'CORRECT' in d.get('text', ''))
-				incorrect_count = sum(1 for d in past_decisions if 'INCORRECT' in d.get('text', ''))
+				# Single pass; match the whole result line so INCORRECT is not also counted as CORRECT
+				correct_count = incorrect_count = 0
+				for d in past_decisions:
+					match = _RESULT_RE.search(d.get('text', ''))
+					if match is None:
+						continue
+					if match.group(1) == 'CORRECT':
+						correct_count += 1
+					else:
+						incorrect_count += 1
 				
 				if correct_count + incorrect_count > 0:
 					success_rate = correct_count / (correct_count + incorrect_count)
@@ -410,69 +510,30 @@ async def analyze_market_for_betting(
 					learning_insights += f"{success_rate:.1%} success rate. "
 					
 					# Extract common patterns
-					if success_rate > 0.6:
-						learning_insights += "Similar markets have been profitable. "
-					elif success_rate < 0.4:
-						learning_insights += "Caution: Similar markets have had poor results. "
+					insight = 'profitable' if success_rate > 0.6 else 'poor' if success_rate < 0.4 else None
+					if insight:
+						learning_insights += _INSIGHT_NOTES[insight]
 			else:
-				print('ℹ️  No past decisions found for similar markets')
+				logger.info('ℹ️  No past decisions found for similar markets')
 		except Exception as e:
-			print(f'⚠️  Error learning from past decisions: {e}')
+			logger.warning('⚠️  Error learning from past decisions: %s', e)
 	
 	# Extract key information
-	market_id = data.get('market_id')
 	outcomes = data.get('outcomes', [])
 	current_prices = data.get('current_prices', {})
 	total_volume = data.get('total_volume', 0)
 	liquidity = data.get('liquidity', 0)
-	status = data.get('status', 'active')
 	
 	# Simple decision logic (example only)
 	# In practice, you'd use ML models, statistical analysis, etc.
 	
-	if status != 'active':
-		return BettingDecision(
-			market_id=market_id,
-			decision='no_action',
-			confidence=1.0,
-			reasoning=f"Market is {status}, cannot trade",
-			risk_assessment='high',
-			value_opportunity=False,
-		)
-	
-	# Find outcome with lowest price (might be undervalued)
-	lowest_price_outcome = None
-	lowest_price = 1.0
-	
-	for outcome, price in current_prices.items():
-		if price < lowest_price:
-			lowest_price = price
-			lowest_price_outcome = outcome
-	
-	# Find outcome with highest price (most likely)
-	highest_price_outcome = None
-	highest_price = 0.0
-	
-	for outcome, price in current_prices.items():
-		if price > highest_price:
-			highest_price = price
-			highest_price_outcome = outcome
+	# Find the lowest priced outcome (might be undervalued) and the highest
+	# priced one (most likely)
+	lowest_price_outcome, lowest_price, highest_price_outcome, highest_price = _price_extremes(current_prices)
 	
 	# Incorporate learning from past decisions
-	if learning_insights and 'profitable' in learning_insights.lower():
-		# Past similar decisions were profitable - slightly increase confidence
-		if lowest_price < 0.35:  # Lower threshold if past decisions were good
-			base_threshold = 0.35
-		else:
-			base_threshold = 0.3
-	elif learning_insights and 'poor' in learning_insights.lower():
-		# Past similar decisions had poor results - be more cautious
-		if lowest_price < 0.25:  # Lower threshold, need stronger signal
-			base_threshold = 0.25
-		else:
-			base_threshold = 0.3
-	else:
-		base_threshold = 0.3
+	threshold, fallback_threshold = _BUY_THRESHOLDS[insight]
+	base_threshold = threshold if lowest_price < threshold else fallback_threshold
 	
 	# Simple strategy: if lowest price is below threshold, might be undervalued
 	# If highest price is above 0.7, might be overvalued
@@ -483,16 +544,17 @@ async def analyze_market_for_betting(
 		base_confidence = 0.5
 		
 		# Adjust confidence based on past decisions
-		if learning_insights and 'profitable' in learning_insights.lower():
+		if insight == 'profitable':
 			base_confidence = min(0.7, base_confidence + 0.1)  # Increase confidence
-		elif learning_insights and 'poor' in learning_insights.lower():
+		elif insight == 'poor':
 			base_confidence = max(0.3, base_confidence - 0.1)  # Decrease confidence
 		
 		confidence = base_confidence
 		decision = 'buy'
 		outcome = lowest_price_outcome
 		
-		reasoning = f"Lowest priced outcome '{outcome}' at {lowest_price:.2%} may be undervalued. Market price suggests {lowest_price:.2%} probability but might have higher actual probability."
+		pct = format(lowest_price, '.2%')
+		reasoning = f"Lowest priced outcome '{outcome}' at {pct} may be undervalued. Market price suggests {pct} probability but might have higher actual probability."
 		if learning_insights:
 			reasoning += f"\n\nLearning: {learning_insights}"
 		
@@ -537,7 +599,8 @@ async def analyze_market_for_betting(
 		risk_assessment=risk_assessment,
 		price_discrepancy=price_discrepancy,
 		value_opportunity=value_opportunity,
-		past_decisions_used=[{'text': d.get('text', ''), 'score': d.get('score', 0)} for d in past_decisions] if past_decisions else None,
+		# query_past_decisions already returns trimmed {'text', 'score'} records
+		past_decisions_used=past_decisions or None,
 		learning_insights=learning_insights,
 	)
 
@@ -548,41 +611,42 @@ async def main():
 	parser = argparse.ArgumentParser(description='Make betting decisions using Polymarket data')
 	parser.add_argument('--replit', action='store_true', help='Use Replit API for analysis')
 	parser.add_argument('--replit-api-key', type=str, help='Replit API key')
-	parser.add_argument('--input', type=str, default='polymarket_data.json', help='Input JSON file')
+	parser.add_argument('--input', type=str, default='polymarket_data.jsonl', help='Input JSON Lines file')
 	parser.add_argument('--output', type=str, default='betting_decision.json', help='Output JSON file')
 	
 	args = parser.parse_args()
 	
 	# Load data collected by polymarket_collector.py
 	try:
-		with open(args.input, 'r') as f:
-			data_list = json.load(f)
-			# Use most recent data
-			if data_list:
-				latest_data = data_list[-1]
+		with open(args.input, 'r', encoding='utf-8') as f:
+			# Use most recent data (last non-empty JSON line)
+			latest_line = None
+			for line in f:
+				if line.strip():
+					latest_line = line
+			if latest_line:
+				latest_data = json_loads(latest_line)
 			else:
-				print("❌ No data found in polymarket_data.json")
-				print("   Run polymarket_collector.py first to collect data")
+				logger.error("❌ No data found in %s\n   Run polymarket_collector.py first to collect data", args.input)
 				return
 	except FileNotFoundError:
-		print(f"❌ {args.input} not found")
-		print("   Run polymarket_collector.py first to collect data")
+		logger.error("❌ %s not found\n   Run polymarket_collector.py first to collect data", args.input)
 		return
 	
-	print("📊 Analyzing Polymarket Data for Betting Decision")
+	logger.info("📊 Analyzing Polymarket Data for Betting Decision")
 	if args.replit:
-		print("🤖 Using Replit API for analysis")
+		logger.info("🤖 Using Replit API for analysis")
 	
 	# Initialize Hyperspell for learning
 	hyperspell_client = None
 	if HYPERSPELL_AVAILABLE:
 		hyperspell_client = get_hyperspell_client()
 		if hyperspell_client:
-			print("🧠 Hyperspell enabled - learning from past decisions")
+			logger.info("🧠 Hyperspell enabled - learning from past decisions")
 	else:
-		print("⚠️  Hyperspell not available - install with: pip install hyperspell")
+		logger.warning("⚠️  Hyperspell not available - install with: pip install hyperspell")
 	
-	print("=" * 60)
+	logger.info("=" * 60)
 	
 	# Make decision
 	if args.replit:
@@ -590,49 +654,54 @@ async def main():
 	else:
 		decision = await analyze_market_for_betting(latest_data, hyperspell_client)
 	
-	# Display decision
-	print(f"\n🎯 Decision: {decision.decision.upper()}")
-	print(f"📈 Outcome: {decision.outcome or 'N/A'}")
-	print(f"💪 Confidence: {decision.confidence:.2%}")
-	print(f"⚠️  Risk: {decision.risk_assessment.upper()}")
-	print(f"💰 Suggested Position: ${decision.suggested_position_size:.2f}" if decision.suggested_position_size else "💰 Suggested Position: N/A")
-	print(f"💡 Value Opportunity: {'Yes' if decision.value_opportunity else 'No'}")
+	# Display decision (formatting is deferred to the logging handler)
+	logger.info(
+		"\n🎯 Decision: %s\n📈 Outcome: %s\n💪 Confidence: %.2f%%\n⚠️  Risk: %s\n💰 Suggested Position: %s\n💡 Value Opportunity: %s",
+		decision.decision.upper(),
+		decision.outcome or 'N/A',
+		decision.confidence * 100,
+		decision.risk_assessment.upper(),
+		f"${decision.suggested_position_size:.2f}" if decision.suggested_position_size else 'N/A',
+		'Yes' if decision.value_opportunity else 'No',
+	)
 	
 	# Display learning insights
 	if decision.learning_insights:
-		print(f"\n🧠 Learning Insights:\n{decision.learning_insights}")
+		logger.info("\n🧠 Learning Insights:\n%s", decision.learning_insights)
 	if decision.past_decisions_used:
-		print(f"\n📚 Used {len(decision.past_decisions_used)} past decisions for learning")
+		logger.info("\n📚 Used %d past decisions for learning", len(decision.past_decisions_used))
 	
-	print(f"\n📝 Reasoning:\n{decision.reasoning}")
+	logger.info("\n📝 Reasoning:\n%s", decision.reasoning)
 	
 	# Save decision
 	decision_data = decision.model_dump()
 	decision_data['analyzed_at'] = datetime.now().isoformat()
 	decision_data['analysis_method'] = 'replit' if args.replit else 'local'
 	
-	with open(args.output, 'w') as f:
-		json.dump(decision_data, f, indent=2, ensure_ascii=False)
+	decision_json = json_dumps(decision_data, indent=True)
+	with open(args.output, 'w', encoding='utf-8') as f:
+		f.write(decision_json)
 	
-	print(f"\n💾 Decision saved to: {args.output}")
+	logger.info("\n💾 Decision saved to: %s", args.output)
 	
 	# Store decision in Hyperspell for future learning
 	if hyperspell_client:
 		try:
-			print('\n💾 Storing decision in Hyperspell for future learning...')
+			logger.info('\n💾 Storing decision in Hyperspell for future learning...')
 			success = await store_decision(hyperspell_client, decision, latest_data)
 			if success:
-				print('✓ Decision stored successfully')
+				logger.info('✓ Decision stored successfully')
 			else:
-				print('⚠️  Failed to store decision in Hyperspell')
+				logger.warning('⚠️  Failed to store decision in Hyperspell')
 		except Exception as e:
-			print(f'⚠️  Error storing decision: {e}')
+			logger.warning('⚠️  Error storing decision: %s', e)
 	
 	print("\n📋 JSON Output:")
-	print(json.dumps(decision_data, indent=2, ensure_ascii=False))
+	print(decision_json)
 
 
 if __name__ == '__main__':
-	import asyncio
+	# Progress messages from the library functions go through logging
+	logging.basicConfig(level=logging.INFO, format='%(message)s')
 	asyncio.run(main())
 
@@ -0,0 +1,31 @@
+"""
+JSON helpers shared by the Polymarket agents
+
+Uses orjson when it is installed (several times faster than stdlib json for our
+payloads) and falls back to the stdlib otherwise. Both paths emit UTF-8 text
+rather than ASCII escapes.
+"""
+
+import json
+from typing import Any
+
+# orjson is optional
+try:
+	import orjson
+except ImportError:
+	orjson = None
+
+
+def json_dumps(obj: Any, indent: bool = False) -> str:
+	"""Serialize obj to a JSON string, using orjson when it is installed."""
+	if orjson is not None:
+		option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0)
+		return orjson.dumps(obj, option=option).decode()
+	return json.dumps(obj, indent=2 if indent else None, ensure_ascii=False)
+
+
+def json_loads(text: str | bytes) -> Any:
+	"""Parse a JSON document, using orjson when it is installed."""
+	if orjson is not None:
+		return orjson.loads(text)
+	return json.loads(text)
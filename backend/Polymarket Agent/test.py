@@ -10,6 +10,7 @@ This demonstrates the full workflow:
 
 import asyncio
 import json
+import logging
 import os
 from datetime import datetime
 
@@ -57,7 +58,7 @@ async def example_workflow(market_query: str = "Will Biden win the 2024 election
 		display_data(market_data)
 		
 		# Save to file
-		await save_data(market_data, 'polymarket_data.json')
+		await save_data(market_data, 'polymarket_data.jsonl')
 		
 		print("\n✅ Data collection complete!")
 		
@@ -90,7 +91,7 @@ async def example_workflow(market_query: str = "Will Biden win the 2024 election
 		)
 		
 		display_data(market_data)
-		await save_data(market_data, 'polymarket_data.json')
+		await save_data(market_data, 'polymarket_data.jsonl')
 	
 	# Step 2: Make betting decision with learning
 	print("\n\n" + "=" * 70)
@@ -177,7 +178,7 @@ async def example_workflow(market_query: str = "Will Biden win the 2024 election
 	print("   3. Made betting decision with Hyperspell learning")
 	print("   4. Stored decision for future learning")
 	print("\n📁 Files created:")
-	print("   - polymarket_data.json (market data)")
+	print("   - polymarket_data.jsonl (market data)")
 	print("   - betting_decision.json (decision result)")
 	print("\n💡 Next steps:")
 	print("   - When market resolves, update outcome using:")
@@ -268,6 +269,7 @@ async def main():
 
 
 if __name__ == '__main__':
+	logging.basicConfig(level=logging.INFO, format='%(message)s')
 	print("\n🚀 Starting Polymarket Data Collection & Decision-Making Example\n")
 	
 	# Run the example
@@ -18,8 +18,11 @@ Endpoints:
 """
 
 import asyncio
-import json
+import logging
 import os
+import threading
+import zlib
+from collections import deque
 from datetime import datetime
 from typing import Optional
 
@@ -27,6 +30,12 @@ from dotenv import load_dotenv
 from flask import Flask, jsonify, request
 from flask_cors import CORS
 
+# flask-compress is optional; it gzips the (potentially large) JSON list responses
+try:
+	from flask_compress import Compress
+except ImportError:
+	Compress = None
+
 # Load environment variables
 load_dotenv()
 
@@ -34,29 +43,213 @@ load_dotenv()
 from polymarket_collector import (
 	collect_market_data,
 	save_data,
+	load_history,
+	find_in_history,
+	topic_from_identifier,
+	topics_match,
 	display_data,
 	PolymarketTradeData,
 )
+from polymarket_json import json_dumps
 from polymarket_decision_example import (
+	BettingDecision,
 	analyze_market_for_betting,
+	query_past_decisions,
 	store_decision,
 	get_hyperspell_client,
 	update_decision_outcome,
 )
 
+logger = logging.getLogger(__name__)
+
 app = Flask(__name__)
 CORS(app)  # Enable CORS for frontend access
+if Compress is not None:
+	app.config['COMPRESS_MIMETYPES'] = ['application/json']
+	app.config['COMPRESS_LEVEL'] = 5
+	Compress(app)
 
 # Data storage (in production, use a database)
-markets_data = []
-decisions_data = []
+MARKETS_FILE = 'polymarket_data.jsonl'
+DECISIONS_FILE = 'betting_decision.jsonl'
+# In-memory copies are bounded; evicting a record also drops it from the indexes
+MEMORY_LIMIT = 10_000
+markets_data: deque[dict] = deque()
+decisions_data: deque[dict] = deque()
+# Same records indexed by market_id, kept in step with the deques above
+markets_by_id: dict[str, dict] = {}
+decisions_by_market: dict[str, list[dict]] = {}
+# Guards the four containers above; request threads run concurrently
+_memory_lock = threading.Lock()
+
+# Parsed file contents by path as (stamp, records, records grouped by market_id),
+# reused until the file's mtime or size changes
+_file_cache: dict[str, tuple[tuple[int, int], list, dict[str, list[dict]]]] = {}
+# Guards _file_cache; held while a stale file is re-parsed, so concurrent requests
+# wait for one parse instead of each re-reading the same file
+_file_cache_lock = threading.Lock()
+
+
+def _cached_entry(path: str, load: bool = True) -> tuple[tuple[int, int], list, dict[str, list[dict]]] | None:
+	"""
+	Parse a JSON Lines file and index it by market_id, unless the cached copy is current.
+	
+	With load=False a stale or missing entry is not refreshed and None is returned.
+	"""
+	with _file_cache_lock:
+		st = os.stat(path)
+		stamp = (st.st_mtime_ns, st.st_size)
+		cached = _file_cache.get(path)
+		if cached and cached[0] == stamp:
+			return cached
+		if not load:
+			return None
+		records = list(load_history(path))
+		by_market: dict[str, list[dict]] = {}
+		for record in records:
+			by_market.setdefault(record.get('market_id'), []).append(record)
+		entry = _file_cache[path] = (stamp, records, by_market)
+		return entry
+
+
+def _load_cached(path: str) -> list:
+	"""
+	Return the records in a JSON Lines file, re-reading only when the file changed.
+	
+	The returned list is shared between requests and must not be mutated.
+	"""
+	return _cached_entry(path)[1]
+
+
+def _load_by_market(path: str) -> dict[str, list[dict]]:
+	"""Return the records in a JSON Lines file grouped by market_id, oldest first (shared, read-only)."""
+	return _cached_entry(path)[2]
+
+
+def _file_etag(path: str) -> str | None:
+	"""ETag for a listing read from path: the file's stamp plus the query string, or None if it is missing."""
+	try:
+		st = os.stat(path)
+	except OSError:
+		return None
+	return f'{st.st_mtime_ns:x}-{st.st_size:x}-{zlib.crc32(request.query_string):x}'
+
+
+def _not_modified(etag: str | None):
+	"""A 304 response if the client already holds the listing tagged etag, else None."""
+	if etag and request.if_none_match.contains(etag):
+		response = app.response_class(status=304)
+		response.set_etag(etag)
+		return response
+	return None
+
+
+def _find_market_on_disk(market_id: str) -> dict | None:
+	"""Latest stored record for market_id: from the parsed file if cached, else by streaming it."""
+	entry = _cached_entry(MARKETS_FILE, load=False)
+	if entry is None:
+		# One lookup doesn't justify parsing and indexing the whole collector log
+		return find_in_history(market_id, MARKETS_FILE)
+	matches = entry[2].get(market_id)
+	return matches[-1] if matches else None
+
+
+def _remember_market(market_dict: dict):
+	"""Keep a collected market in memory for lookups when the data file is unavailable."""
+	with _memory_lock:
+		if len(markets_data) >= MEMORY_LIMIT:
+			oldest = markets_data.popleft()
+			# Only unindex it if a newer collection of the same market hasn't replaced it
+			if markets_by_id.get(oldest.get('market_id')) is oldest:
+				del markets_by_id[oldest.get('market_id')]
+		markets_data.append(market_dict)
+		markets_by_id[market_dict.get('market_id')] = market_dict
+
+
+def _remember_decision(decision_dict: dict):
+	"""Keep a decision in memory for lookups when the decision log is unavailable."""
+	with _memory_lock:
+		if len(decisions_data) >= MEMORY_LIMIT:
+			oldest_market_id = decisions_data.popleft().get('market_id')
+			# The evicted decision is the oldest one in its market's group too
+			group = decisions_by_market[oldest_market_id]
+			del group[0]
+			if not group:
+				del decisions_by_market[oldest_market_id]
+		decisions_data.append(decision_dict)
+		decisions_by_market.setdefault(decision_dict.get('market_id'), []).append(decision_dict)
+
+
+def _append_decision(decision_dict: dict):
+	"""Append one decision to the JSON Lines decision log."""
+	with open(DECISIONS_FILE, 'a', encoding='utf-8') as f:
+		f.write(json_dumps(decision_dict) + '\n')
+	with _file_cache_lock:
+		_file_cache.pop(DECISIONS_FILE, None)
+
+
+def _finalize_decision(decision: BettingDecision, use_replit: bool) -> dict:
+	"""Dump a decision once, stamp it, and record it in memory and in the decision log."""
+	decision_dict = decision.model_dump()
+	decision_dict['analyzed_at'] = datetime.now().isoformat()
+	decision_dict['analysis_method'] = 'replit' if use_replit else 'local'
+	
+	_remember_decision(decision_dict)
+	_append_decision(decision_dict)
+	return decision_dict
+
+
+# One long-lived event loop on a daemon thread: connection pools owned by the
+# collector (e.g. the pooled Perplexity client) survive across requests
+_loop = asyncio.new_event_loop()
+threading.Thread(target=_loop.run_forever, name='api-event-loop', daemon=True).start()
 
 
 def run_async(coro):
-	"""Run async function in Flask."""
-	loop = asyncio.new_event_loop()
-	asyncio.set_event_loop(loop)
-	return loop.run_until_complete(coro)
+	"""Run async function in Flask on the shared background loop and wait for the result."""
+	return asyncio.run_coroutine_threadsafe(coro, _loop).result()
+
+
+def run_in_background(coro, description: str):
+	"""Schedule a coroutine on the shared loop without waiting for it; failures are logged."""
+	def report(future):
+		if not future.cancelled() and future.exception() is not None:
+			logger.warning('⚠️  Background %s failed: %s', description, future.exception())
+	
+	future = asyncio.run_coroutine_threadsafe(coro, _loop)
+	future.add_done_callback(report)
+	return future
+
+
+async def _collect_with_past_decisions(
+	market_identifier: str,
+	method: str,
+	headless: bool,
+	hyperspell_client,
+) -> tuple[PolymarketTradeData, list[dict] | None]:
+	"""
+	Collect a market while querying Hyperspell for past decisions on the requested topic.
+	
+	Returns:
+		The collected market and the prefetched past decisions, or None when there was
+		nothing to prefetch or the market found doesn't match the requested topic
+	"""
+	collect = collect_market_data(
+		market_identifier=market_identifier,
+		method=method,
+		headless=headless,
+	)
+	topic = topic_from_identifier(market_identifier, method)
+	if not (hyperspell_client and topic):
+		return await collect, None
+	
+	market_data, past_decisions = await asyncio.gather(
+		collect,
+		query_past_decisions(hyperspell_client, topic, limit=5),
+	)
+	if not topics_match(topic, market_data.market_title):
+		past_decisions = None
+	return market_data, past_decisions
 
 
 @app.route('/api/health', methods=['GET'])
@@ -99,12 +292,10 @@ def collect_market():
 			)
 		)
 		
-		# Save to file
-		run_async(save_data(market_data, 'polymarket_data.json'))
-		
-		# Store in memory
+		# Save to file and store in memory
 		market_dict = market_data.model_dump()
-		markets_data.append(market_dict)
+		run_async(save_data(market_dict, MARKETS_FILE))
+		_remember_market(market_dict)
 		
 		return jsonify({
 			'success': True,
@@ -141,30 +332,23 @@ def make_decision():
 		if provided_market_data:
 			market_data_dict = provided_market_data
 		elif market_id:
-			# Find market by ID
-			market_data_dict = next(
-				(m for m in markets_data if m.get('market_id') == market_id),
-				None
-			)
+			# Find market by ID (latest collection wins)
+			with _memory_lock:
+				market_data_dict = markets_by_id.get(market_id)
 			if not market_data_dict:
 				# Try loading from file
 				try:
-					with open('polymarket_data.json', 'r') as f:
-						all_markets = json.load(f)
-						market_data_dict = next(
-							(m for m in all_markets if m.get('market_id') == market_id),
-							None
-						)
+					market_data_dict = _find_market_on_disk(market_id)
 				except Exception:
 					pass
 		else:
 			# Use latest market data
 			try:
-				with open('polymarket_data.json', 'r') as f:
-					all_markets = json.load(f)
-					market_data_dict = all_markets[-1] if all_markets else None
+				all_markets = _load_cached(MARKETS_FILE)
+				market_data_dict = all_markets[-1] if all_markets else None
 			except Exception:
-				market_data_dict = markets_data[-1] if markets_data else None
+				with _memory_lock:
+					market_data_dict = markets_data[-1] if markets_data else None
 		
 		if not market_data_dict:
 			return jsonify({
@@ -186,28 +370,12 @@ def make_decision():
 				analyze_market_for_betting(market_data_dict, hyperspell_client)
 			)
 		
-		# Store decision in Hyperspell
+		# Store decision in Hyperspell off the response path
 		if hyperspell_client:
-			run_async(store_decision(hyperspell_client, decision, market_data_dict))
+			run_in_background(store_decision(hyperspell_client, decision, market_data_dict), 'Hyperspell store')
 		
 		# Save decision
-		decision_dict = decision.model_dump()
-		decision_dict['analyzed_at'] = datetime.now().isoformat()
-		decision_dict['analysis_method'] = 'replit' if use_replit else 'local'
-		
-		decisions_data.append(decision_dict)
-		
-		# Save to file
-		try:
-			with open('betting_decision.json', 'r') as f:
-				all_decisions = json.load(f)
-		except Exception:
-			all_decisions = []
-		
-		all_decisions.append(decision_dict)
-		
-		with open('betting_decision.json', 'w') as f:
-			json.dump(all_decisions, f, indent=2, ensure_ascii=False)
+		decision_dict = _finalize_decision(decision, use_replit)
 		
 		return jsonify({
 			'success': True,
@@ -227,28 +395,38 @@ def make_decision():
 def get_decisions():
 	"""Get all decisions."""
 	try:
-		# Try loading from file
-		try:
-			with open('betting_decision.json', 'r') as f:
-				all_decisions = json.load(f)
-		except Exception:
-			all_decisions = decisions_data
-		
 		# Get query parameters
 		limit = request.args.get('limit', type=int)
 		market_id = request.args.get('market_id')
 		
-		if market_id:
-			all_decisions = [d for d in all_decisions if d.get('market_id') == market_id]
+		# Repeat polls of an unchanged log get a 304 without touching the records
+		etag = _file_etag(DECISIONS_FILE)
+		if (not_modified := _not_modified(etag)) is not None:
+			return not_modified
+		
+		# Try loading from file
+		try:
+			if market_id:
+				all_decisions = _load_by_market(DECISIONS_FILE).get(market_id, [])
+			else:
+				all_decisions = _load_cached(DECISIONS_FILE)
+		except Exception:
+			# Snapshot under the lock, slice outside it
+			with _memory_lock:
+				all_decisions = list(decisions_by_market.get(market_id, ()) if market_id else decisions_data)
+			etag = None
 		
 		if limit:
 			all_decisions = all_decisions[-limit:]
 		
-		return jsonify({
+		response = jsonify({
 			'success': True,
 			'decisions': all_decisions,
 			'count': len(all_decisions),
-		}), 200
+		})
+		if etag:
+			response.set_etag(etag)
+		return response, 200
 		
 	except Exception as e:
 		return jsonify({
@@ -261,12 +439,18 @@ def get_decisions():
 def get_markets():
 	"""Get all collected markets."""
 	try:
+		# Repeat polls of an unchanged file get a 304 without touching the records
+		etag = _file_etag(MARKETS_FILE)
+		if (not_modified := _not_modified(etag)) is not None:
+			return not_modified
+		
 		# Try loading from file
 		try:
-			with open('polymarket_data.json', 'r') as f:
-				all_markets = json.load(f)
+			all_markets = _load_cached(MARKETS_FILE)
 		except Exception:
-			all_markets = markets_data
+			with _memory_lock:
+				all_markets = list(markets_data)
+			etag = None
 		
 		# Get query parameters
 		limit = request.args.get('limit', type=int)
@@ -278,11 +462,14 @@ def get_markets():
 		if limit:
 			all_markets = all_markets[-limit:]
 		
-		return jsonify({
+		response = jsonify({
 			'success': True,
 			'markets': all_markets,
 			'count': len(all_markets),
-		}), 200
+		})
+		if etag:
+			response.set_etag(etag)
+		return response, 200
 		
 	except Exception as e:
 		return jsonify({
@@ -373,23 +560,24 @@ def collect_and_decide():
 		if not market_identifier:
 			return jsonify({'error': 'market_identifier is required'}), 400
 		
-		# Step 1: Collect market data
-		market_data = run_async(
-			collect_market_data(
-				market_identifier=market_identifier,
-				method=method,
-				headless=headless,
+		hyperspell_client = get_hyperspell_client()
+		
+		# Step 1: Collect market data, fetching past decisions for local analysis meanwhile
+		market_data, past_decisions = run_async(
+			_collect_with_past_decisions(
+				market_identifier,
+				method,
+				headless,
+				None if use_replit else hyperspell_client,
 			)
 		)
 		
 		# Save market data
-		run_async(save_data(market_data, 'polymarket_data.json'))
 		market_dict = market_data.model_dump()
-		markets_data.append(market_dict)
+		run_async(save_data(market_dict, MARKETS_FILE))
+		_remember_market(market_dict)
 		
 		# Step 2: Make decision
-		hyperspell_client = get_hyperspell_client()
-		
 		if use_replit:
 			from polymarket_decision_example import analyze_with_replit
 			decision = run_async(
@@ -397,30 +585,15 @@ def collect_and_decide():
 			)
 		else:
 			decision = run_async(
-				analyze_market_for_betting(market_dict, hyperspell_client)
+				analyze_market_for_betting(market_dict, hyperspell_client, past_decisions)
 			)
 		
-		# Store decision
+		# Store decision off the response path
 		if hyperspell_client:
-			run_async(store_decision(hyperspell_client, decision, market_dict))
-		
-		decision_dict = decision.model_dump()
-		decision_dict['analyzed_at'] = datetime.now().isoformat()
-		decision_dict['analysis_method'] = 'replit' if use_replit else 'local'
-		
-		decisions_data.append(decision_dict)
+			run_in_background(store_decision(hyperspell_client, decision, market_dict), 'Hyperspell store')
 		
 		# Save decision
-		try:
-			with open('betting_decision.json', 'r') as f:
-				all_decisions = json.load(f)
-		except Exception:
-			all_decisions = []
-		
-		all_decisions.append(decision_dict)
-		
-		with open('betting_decision.json', 'w') as f:
-			json.dump(all_decisions, f, indent=2, ensure_ascii=False)
+		decision_dict = _finalize_decision(decision, use_replit)
 		
 		return jsonify({
 			'success': True,
@@ -437,17 +610,24 @@ def collect_and_decide():
 
 
 if __name__ == '__main__':
-	print("🚀 Starting Polymarket API Server...")
-	print("📡 API endpoints:")
-	print("   POST /api/collect - Collect market data")
-	print("   POST /api/decide - Make betting decision")
-	print("   GET  /api/decisions - Get all decisions")
-	print("   GET  /api/markets - Get all markets")
-	print("   POST /api/outcome - Update decision outcome")
-	print("   POST /api/collect-and-decide - Collect and decide in one call")
-	print("   GET  /api/health - Health check")
-	print("\n🌐 Server will start on http://localhost:5000")
-	print("   Frontend can access API at: http://localhost:5000/api/*\n")
+	logging.basicConfig(level=logging.INFO, format='%(message)s')
+	logger.info(
+		"🚀 Starting Polymarket API Server...\n"
+		"📡 API endpoints:\n"
+		"   POST /api/collect - Collect market data\n"
+		"   POST /api/decide - Make betting decision\n"
+		"   GET  /api/decisions - Get all decisions\n"
+		"   GET  /api/markets - Get all markets\n"
+		"   POST /api/outcome - Update decision outcome\n"
+		"   POST /api/collect-and-decide - Collect and decide in one call\n"
+		"   GET  /api/health - Health check\n"
+		"\n🌐 Server will start on http://localhost:5000\n"
+		"   Frontend can access API at: http://localhost:5000/api/*\n"
+	)
 	
-	app.run(host='0.0.0.0', port=5000, debug=True)
+	# Development server only: one thread per request so a slow /api/collect doesn't
+	# block the others. In production run under a WSGI server, e.g.
+	#   gunicorn -k gthread -w 4 --threads 8 -b 0.0.0.0:5000 api_server:app
+	debug = os.getenv('FLASK_DEBUG', '').lower() in ('1', 'true')
+	app.run(host='0.0.0.0', port=5000, debug=debug, threaded=True)
 
@@ -21,16 +21,26 @@ Usage:
 
 import argparse
 import asyncio
-import json
+import atexit
 import os
+import queue
+import random
 import sys
+import time
 import logging
+from logging.handlers import QueueHandler, QueueListener
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional, Literal
+from typing import IO, Any, ClassVar, Dict, Iterator, List, Optional, Literal, Tuple
 
+import httpx
 from dotenv import load_dotenv
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr
+
+try:
+    import websockets
+except ImportError:
+    websockets = None
 
 load_dotenv()
 
@@ -39,6 +49,50 @@ log_dir = Path("logs")
 log_dir.mkdir(exist_ok=True)
 log_file = log_dir / f"agent_thoughts_{datetime.now().strftime('%Y%m%d_%H%M%S')}.log"
 
+class RateLimitedFilter(logging.Filter):
+    """
+    Pass at most one exception record per exception type per interval.
+    
+    Records dropped in between are counted and the count is appended to the next
+    record that gets through. Attached to the queue handler, so dropped records
+    never have their traceback formatted.
+    """
+    
+    def __init__(self, interval: float = 1.0):
+        super().__init__()
+        self.interval = interval
+        self._last_emit: Dict[str, float] = {}
+        self._suppressed: Dict[str, int] = {}
+    
+    def filter(self, record: logging.LogRecord) -> bool:
+        if not record.exc_info or record.exc_info[0] is None:
+            return True
+        key = record.exc_info[0].__name__
+        now = time.monotonic()
+        if now - self._last_emit.get(key, float("-inf")) < self.interval:
+            self._suppressed[key] = self._suppressed.get(key, 0) + 1
+            return False
+        self._last_emit[key] = now
+        suppressed = self._suppressed.pop(key, 0)
+        if suppressed:
+            record.msg = f"{record.msg} ({suppressed} more {key} errors suppressed)"
+        return True
+
+
+class DeferredFormatQueueHandler(QueueHandler):
+    """
+    Queue records without formatting them.
+    
+    The stdlib QueueHandler.prepare() formats the message, merges args and renders
+    the traceback on the calling thread, which here is the event loop. The listener
+    runs in this process, so the record can be queued as-is and formatted by the
+    listener's handlers on its own thread.
+    """
+    
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+
 # Create logger
 logger = logging.getLogger("AgentThoughts")
 logger.setLevel(logging.INFO)
@@ -48,14 +102,34 @@ file_handler = logging.FileHandler(log_file, encoding='utf-8')
 file_handler.setLevel(logging.INFO)
 file_formatter = logging.Formatter('%(asctime)s | %(levelname)s | %(message)s', datefmt='%Y-%m-%d %H:%M:%S')
 file_handler.setFormatter(file_formatter)
-logger.addHandler(file_handler)
 
 # Console handler - keep existing console output
 console_handler = logging.StreamHandler()
 console_handler.setLevel(logging.WARNING)  # Only show warnings/errors on console
-logger.addHandler(console_handler)
 
-print(f"📝 Agent thoughts logging to: {log_file}")
+# The agent logs heavily from the event loop: records are only queued there, and
+# formatting (message args and tracebacks) plus file/console writes happen on the
+# listener's thread
+log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+log_queue_handler = DeferredFormatQueueHandler(log_queue)
+log_queue_handler.addFilter(RateLimitedFilter())
+logger.addHandler(log_queue_handler)
+log_listener = QueueListener(log_queue, file_handler, console_handler, respect_handler_level=True)
+log_listener.start()
+atexit.register(log_listener.stop)  # flushes queued records on exit
+
+# Console progress output: also queued, so stdout writes happen on
+# the listener's thread instead of blocking the event loop when stdout is a slow pipe
+console = logging.getLogger("AgentConsole")
+console.setLevel(logging.INFO)
+console.propagate = False
+console_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+console.addHandler(DeferredFormatQueueHandler(console_queue))
+console_listener = QueueListener(console_queue, logging.StreamHandler(sys.stdout))
+console_listener.start()
+atexit.register(console_listener.stop)
+
+console.info(f"📝 Agent thoughts logging to: {log_file}")
 
 # Add Polymarket Agent directory to path
 backend_dir = os.path.dirname(os.path.abspath(__file__))
@@ -64,12 +138,49 @@ sys.path.insert(0, polymarket_agent_dir)
 
 # Import our existing modules
 from multi_agent_decision import DecisionCoordinator, CollectiveDecision, AgentDecision
-from polymarket_discovery import PolymarketDiscovery, PolymarketMarket
+from polymarket_discovery import PolymarketMarket, fetch_gamma_markets
+from polymarket_json import json_dumps, json_loads
+
+
+CLOB_MARKET_WS_URL = "wss://ws-subscriptions-clob.polymarket.com/ws/market"
+
+# Markets not analysed for this long drop out of the per-market schedule (seconds);
+# well above max_idle_interval, so only markets discovery stopped returning expire
+_MARKET_STATE_TTL = 24 * 3600
+
+
+def _now_iso() -> str:
+    """Current local time as an ISO-8601 string, the format every timestamp here uses."""
+    return datetime.now().isoformat()
+
+
+def _cents(amount: float) -> float:
+    """Round a dollar amount to whole cents, so running balances don't accumulate float error."""
+    return round(amount, 2)
+
+
+def _trade_pnl(action: str, outcome: str, resolved_outcome: str, price: float, shares: float, size: float) -> float:
+    """PnL of a single trade once its market has resolved."""
+    if action == "buy" and outcome == resolved_outcome:
+        return (1.0 - price) * shares  # Won the bet
+    if action == "sell" and outcome != resolved_outcome:
+        return price * shares  # Correctly sold
+    return -size  # Lost the bet
+
+
+# Shared by the agent's models: the portfolio is mutated field-by-field in add_trade/close_trade
+# and everything is rebuilt from our own saved JSON, so neither assignments nor nested
+# instances are re-validated
+_MODEL_CONFIG = ConfigDict(validate_assignment=False, revalidate_instances="never", extra="ignore")
+# Market snapshots and trade records never change once built; closing a trade replaces it
+_RECORD_CONFIG = ConfigDict(**_MODEL_CONFIG, frozen=True)
 
 
 # Simplified MarketData for autonomous trading
 class MarketData(BaseModel):
     """Market data for trading decisions."""
+    model_config = _RECORD_CONFIG
+    
     market_id: Optional[str] = None
     market_title: str
     market_url: Optional[str] = None
@@ -80,11 +191,13 @@ class MarketData(BaseModel):
     end_date: Optional[str] = None
     status: str = "active"
     market_context: Optional[str] = None
-    collected_at: str = Field(default_factory=lambda: datetime.now().isoformat())
+    collected_at: str = Field(default_factory=_now_iso)
 
 
 class TradeExecution(BaseModel):
     """Model for an executed trade."""
+    model_config = _RECORD_CONFIG
+    
     
     trade_id: str = Field(description="Unique trade identifier")
     market_id: str
@@ -114,6 +227,8 @@ class TradeExecution(BaseModel):
 
 class Portfolio(BaseModel):
     """Portfolio state for frontend."""
+    model_config = _MODEL_CONFIG
+    
     
     total_value: float = Field(default=10000.0, description="Total portfolio value")
     cash: float = Field(default=10000.0, description="Available cash")
@@ -126,54 +241,231 @@ class Portfolio(BaseModel):
     total_trades: int = Field(default=0)
     winning_trades: int = Field(default=0)
     
-    last_updated: str = Field(default_factory=lambda: datetime.now().isoformat())
+    last_updated: str = Field(default_factory=_now_iso)
+    
+    # closed_positions keeps only the most recent trades; the performance metrics
+    # above are running totals, so they still cover every trade
+    MAX_CLOSED_POSITIONS: ClassVar[int] = 500
+    
+    # trade_id -> open trade, so closing a position doesn't scan active_positions
+    _active_by_id: Dict[str, TradeExecution] = PrivateAttr(default_factory=dict)
+    # trade_id -> index in active_positions, so a closed trade is swapped out instead of searched for
+    _position_index: Dict[str, int] = PrivateAttr(default_factory=dict)
+    # Sum of active_positions' sizes, kept in step by add_trade/close_trade
+    _open_cost: float = PrivateAttr(default=0.0)
     
-    def add_trade(self, trade: TradeExecution):
-        """Add a new trade to portfolio."""
+    def model_post_init(self, __context: Any) -> None:
+        self._trim_closed_positions()
+        self._active_by_id = {trade.trade_id: trade for trade in self.active_positions}
+        self._reindex_positions()
+        self._open_cost = _cents(sum(trade.size for trade in self.active_positions))
+    
+    def add_trade(self, trade: TradeExecution, now_iso: Optional[str] = None):
+        """Add a new trade to portfolio. Callers that already have a timestamp pass it as now_iso."""
+        self._position_index[trade.trade_id] = len(self.active_positions)
         self.active_positions.append(trade)
-        self.cash -= trade.size
+        self._active_by_id[trade.trade_id] = trade
+        self._open_cost = _cents(self._open_cost + trade.size)
+        self.cash = _cents(self.cash - trade.size)
         self.total_trades += 1
-        self.last_updated = datetime.now().isoformat()
+        self.last_updated = now_iso or _now_iso()
     
-    def close_trade(self, trade_id: str, final_price: float, resolved_outcome: str):
+    def close_trade(self, trade_id: str, final_price: float, resolved_outcome: str, now_iso: Optional[str] = None):
         """Close a trade and calculate PnL."""
-        for i, trade in enumerate(self.active_positions):
-            if trade.trade_id == trade_id:
-                # Calculate PnL
-                if trade.action == "buy" and trade.outcome == resolved_outcome:
-                    pnl = (1.0 - trade.price) * trade.shares  # Won the bet
-                elif trade.action == "sell" and trade.outcome != resolved_outcome:
-                    pnl = trade.price * trade.shares  # Correctly sold
-                else:
-                    pnl = -trade.size  # Lost the bet
-                
-                # Update trade
-                trade.status = "closed"
-                trade.pnl = pnl
-                trade.resolved_outcome = resolved_outcome
-                
-                # Update portfolio
-                self.cash += trade.size + pnl
-                self.total_pnl += pnl
-                if pnl > 0:
-                    self.winning_trades += 1
-                self.win_rate = self.winning_trades / self.total_trades if self.total_trades > 0 else 0
-                
-                # Move to closed positions
-                self.closed_positions.append(trade)
-                self.active_positions.pop(i)
-                self.last_updated = datetime.now().isoformat()
-                break
+        trade = self._active_by_id.pop(trade_id, None)
+        if trade is None:
+            return
+        
+        pnl = _cents(_trade_pnl(trade.action, trade.outcome, resolved_outcome, trade.price, trade.shares, trade.size))
+        
+        # Closed record (trades are frozen)
+        closed = trade.model_copy(update={"status": "closed", "pnl": pnl, "resolved_outcome": resolved_outcome})
+        
+        # Update portfolio
+        self.cash = _cents(self.cash + trade.size + pnl)
+        self.total_pnl = _cents(self.total_pnl + pnl)
+        if pnl > 0:
+            self.winning_trades += 1
+        self.win_rate = self.winning_trades / self.total_trades if self.total_trades > 0 else 0
+        
+        # Move to closed positions
+        self.closed_positions.append(closed)
+        self._trim_closed_positions()
+        self._remove_active(trade)
+        self._open_cost = _cents(self._open_cost - trade.size) if self.active_positions else 0.0
+        self.last_updated = now_iso or _now_iso()
+    
+    def settle_batch(
+        self,
+        trade_ids: List[str],
+        resolved_outcomes: List[str],
+        final_prices: List[float],
+        now_iso: Optional[str] = None,
+    ) -> float:
+        """
+        Close many trades in one pass, e.g. for an end-of-day settlement.
+        
+        Args:
+            trade_ids: Trades to close; ids that are not open are skipped
+            resolved_outcomes: Resolved outcome for each trade id
+            final_prices: Final price for each trade id (kept for parity with close_trade)
+            now_iso: Timestamp to record, if the caller already has one
+        
+        Returns:
+            Total PnL of the settled trades
+        """
+        settled = []
+        for trade_id, resolved_outcome in zip(trade_ids, resolved_outcomes):
+            trade = self._active_by_id.pop(trade_id, None)
+            if trade is not None:
+                settled.append((trade, resolved_outcome))
+        if not settled:
+            return 0.0
+        
+        batch_pnl = 0.0
+        for trade, resolved_outcome in settled:
+            pnl = _cents(_trade_pnl(
+                trade.action, trade.outcome, resolved_outcome, trade.price, trade.shares, trade.size
+            ))
+            self.cash = _cents(self.cash + trade.size + pnl)
+            batch_pnl = _cents(batch_pnl + pnl)
+            if pnl > 0:
+                self.winning_trades += 1
+            self.closed_positions.append(
+                trade.model_copy(update={"status": "closed", "pnl": pnl, "resolved_outcome": resolved_outcome})
+            )
+        
+        self._trim_closed_positions()
+        self.total_pnl = _cents(self.total_pnl + batch_pnl)
+        self.win_rate = self.winning_trades / self.total_trades if self.total_trades > 0 else 0
+        # One filter pass over active_positions instead of a list.remove per trade
+        self.active_positions = [trade for trade in self.active_positions if trade.trade_id in self._active_by_id]
+        self._reindex_positions()
+        settled_cost = sum(trade.size for trade, _ in settled)
+        self._open_cost = _cents(self._open_cost - settled_cost) if self.active_positions else 0.0
+        self.last_updated = now_iso or _now_iso()
+        return batch_pnl
+    
+    def _remove_active(self, trade: TradeExecution):
+        """Remove an open trade from active_positions in O(1) by moving the last position into its slot."""
+        index = self._position_index.pop(trade.trade_id)
+        last = self.active_positions.pop()
+        if last is not trade:
+            self.active_positions[index] = last
+            self._position_index[last.trade_id] = index
+    
+    def _reindex_positions(self):
+        self._position_index = {trade.trade_id: i for i, trade in enumerate(self.active_positions)}
+    
+    def _trim_closed_positions(self):
+        """Drop the oldest closed trades beyond MAX_CLOSED_POSITIONS."""
+        excess = len(self.closed_positions) - self.MAX_CLOSED_POSITIONS
+        if excess > 0:
+            del self.closed_positions[:excess]
     
     def get_position_value(self) -> float:
         """Calculate current value of open positions."""
         # Simplified: assume positions worth their cost basis for now
-        return sum(trade.size for trade in self.active_positions)
+        return self._open_cost
     
-    def update_total_value(self):
+    def update_total_value(self, now_iso: Optional[str] = None):
         """Update total portfolio value."""
-        self.total_value = self.cash + self.get_position_value()
-        self.last_updated = datetime.now().isoformat()
+        self.total_value = _cents(self.cash + self.get_position_value())
+        self.last_updated = now_iso or _now_iso()
+    
+    def aggregate_stats(self) -> Dict[str, float]:
+        """
+        Summarise the retained closed positions (the most recent MAX_CLOSED_POSITIONS).
+        
+        win_rate here is the fraction of these closed trades with a positive PnL
+        (break-even counts as a loss, as in close_trade). Unlike Portfolio.win_rate,
+        it does not count open trades in the denominator.
+        
+        Returns:
+            Trade count, realized PnL, win rate, mean PnL and mean position size
+            over closed_positions; all zero when nothing has closed yet
+        """
+        count = len(self.closed_positions)
+        if not count:
+            return {"count": 0, "realized_pnl": 0.0, "win_rate": 0.0, "mean_pnl": 0.0, "mean_size": 0.0}
+        realized = sum(trade.pnl or 0.0 for trade in self.closed_positions)
+        wins = sum(1 for trade in self.closed_positions if (trade.pnl or 0.0) > 0)
+        total_size = sum(trade.size for trade in self.closed_positions)
+        return {
+            "count": count,
+            "realized_pnl": _cents(realized),
+            "win_rate": wins / count,
+            "mean_pnl": _cents(realized / count),
+            "mean_size": _cents(total_size / count),
+        }
+
+
+_TRADE_REQUIRED_FIELDS = frozenset(
+    name for name, field in TradeExecution.model_fields.items() if field.is_required()
+)
+
+
+def _is_trusted_portfolio(data: Any) -> bool:
+    """Whether data has exactly the shape _save_portfolio writes: known top-level keys, complete trades."""
+    if not isinstance(data, dict) or not data.keys() <= Portfolio.model_fields.keys():
+        return False
+    return all(
+        isinstance(trade, dict) and _TRADE_REQUIRED_FIELDS <= trade.keys()
+        for key in ("active_positions", "closed_positions")
+        for trade in data.get(key, ())
+    )
+
+
+def _construct_portfolio(data: Dict[str, Any]) -> Portfolio:
+    """Rebuild a portfolio we saved ourselves without re-validating every trade."""
+    return Portfolio.model_construct(**{
+        **data,
+        "active_positions": [TradeExecution.model_construct(**t) for t in data.get("active_positions", ())],
+        "closed_positions": [TradeExecution.model_construct(**t) for t in data.get("closed_positions", ())],
+    })
+
+
+def load_trade_history(history_path: Path) -> Iterator[TradeExecution]:
+    """Stream executed trades from a JSON Lines history file, oldest first."""
+    with open(history_path, "r", encoding="utf-8") as f:
+        for line in f:
+            if line.strip():
+                yield TradeExecution.model_validate_json(line)
+
+
+def migrate_trade_history(legacy_path: Path, history_path: Path) -> int:
+    """
+    Rewrite a legacy trade history (one JSON list of trades) as JSON Lines.
+    
+    An empty legacy file migrates as an empty history. Every trade is validated
+    first, so a malformed entry raises before anything is written. The legacy file
+    is never modified or deleted: it stays in place as a backup, and the caller
+    only migrates while history_path does not exist, so this runs once. Remove the
+    legacy file by hand once the migrated history has been checked.
+    
+    Args:
+        legacy_path: The old trades_history.json file
+        history_path: The JSON Lines file to create
+        
+    Returns:
+        Number of trades migrated
+        
+    Raises:
+        ValueError: If the legacy file is not a JSON list of valid trades
+    """
+    raw = legacy_path.read_bytes()
+    entries = json_loads(raw) if raw.strip() else []
+    if not isinstance(entries, list):
+        raise ValueError(f"{legacy_path} does not contain a list of trades")
+    # pydantic's ValidationError is a ValueError
+    trades = [TradeExecution.model_validate(entry) for entry in entries]
+    # Written to a temp file and swapped in, so a crash never leaves a partial history
+    tmp_path = history_path.with_suffix(history_path.suffix + ".tmp")
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        for trade in trades:
+            f.write(trade.model_dump_json() + "\n")
+    os.replace(tmp_path, history_path)
+    return len(trades)
 
 
 class AutonomousTradingAgent:
@@ -186,76 +478,159 @@ class AutonomousTradingAgent:
         min_confidence: float = 0.7,
         min_consensus: float = 0.6,
         max_position_size: float = 500.0,
+        max_concurrent_analyses: int = 8,
+        discovery_limit: int = 5,
+        max_idle_interval: int = 3600,
+        portfolio_save_interval: float = 1.0,
+        strict_load: bool = False,
+        rng_seed: Optional[int] = None,
+        analysis_cache_ttl: float = 60.0,
         portfolio_path: str = "data/portfolio.json",
-        trades_history_path: str = "data/trades_history.json",
+        trades_history_path: str = "data/trades_history.jsonl",
     ):
         self.markets_to_monitor = markets_to_monitor
         self.check_interval = check_interval
         self.min_confidence = min_confidence
         self.min_consensus = min_consensus
         self.max_position_size = max_position_size
+        self.max_concurrent_analyses = max_concurrent_analyses
+        self.discovery_limit = discovery_limit
+        self.max_idle_interval = max_idle_interval
+        self.portfolio_save_interval = portfolio_save_interval
+        self.strict_load = strict_load
+        # One generator for the fallback decisions and position sizing; seed it to replay a run
+        self._rng = random.Random(rng_seed)
+        self.analysis_cache_ttl = analysis_cache_ttl
         
         # Paths
         self.portfolio_path = Path(portfolio_path)
         self.trades_history_path = Path(trades_history_path)
-        self.portfolio_path.parent.mkdir(exist_ok=True)
+        # Created once here, so the save paths never need to check
+        self.portfolio_path.parent.mkdir(parents=True, exist_ok=True)
+        self.trades_history_path.parent.mkdir(parents=True, exist_ok=True)
+        # Opened on the first trade and kept open for appends; closed when the agent stops
+        self._history_fp: Optional[IO[str]] = None
+        # One-time upgrade from the old list-JSON history written next to it
+        legacy_history_path = self.trades_history_path.with_suffix(".json")
+        if legacy_history_path.exists() and not self.trades_history_path.exists():
+            try:
+                migrated = migrate_trade_history(legacy_history_path, self.trades_history_path)
+                console.info(
+                    f"📦 Migrated {migrated} trades from {legacy_history_path} to {self.trades_history_path}; "
+                    f"{legacy_history_path} was kept and can be removed"
+                )
+            except Exception as e:
+                console.info(f"⚠️  Error migrating trade history: {e}")
         
         # Initialize components
         self.coordinator = DecisionCoordinator()
-        self.discovery = PolymarketDiscovery(headless=True)
+        # Keep-alive client for Gamma API discovery; open while start() runs
+        self._http: Optional[httpx.AsyncClient] = None
         
         # Load or create portfolio
         self.portfolio = self._load_portfolio()
         
-        # Tracking
-        self.last_analysis: Dict[str, datetime] = {}
+        # Tracking: market key -> time.monotonic() of its last analysis
+        self.last_analysis: Dict[str, float] = {}
+        # Per-market polling schedule (time.monotonic() seconds): quiet markets back off
+        self._market_interval: Dict[str, float] = {}
+        self._market_next_check: Dict[str, float] = {}
+        self._last_prices: Dict[str, float] = {}
+        # Live CLOB prices (needs the optional websockets package): a material move
+        # makes its market due and sets _wake, cutting the sleep between cycles short
+        self._markets_by_token: Dict[str, PolymarketMarket] = {}
+        self._price_stream: Optional[asyncio.Task] = None
+        self._wake = asyncio.Event()
+        # (market key, yes price to the cent) -> (time.monotonic(), decision): a market
+        # re-checked within analysis_cache_ttl at the same price reuses its decision
+        self._analysis_cache: Dict[Tuple[str, float], Tuple[float, CollectiveDecision]] = {}
         self.discovered_markets: List[PolymarketMarket] = []
         self.running = False
+        # Markets are analysed concurrently, at most max_concurrent_analyses at a time;
+        # trades check and spend the same cash, so they run one at a time
+        self._analysis_sem = asyncio.Semaphore(max_concurrent_analyses)
+        self._trade_lock = asyncio.Lock()
+        # Trades and cycles only mark the portfolio dirty; the flusher started by start()
+        # wakes on it and waits portfolio_save_interval so a burst of changes is one write
+        self._portfolio_dirty = asyncio.Event()
+        self._save_lock = asyncio.Lock()
     
     def _load_portfolio(self) -> Portfolio:
         """Load portfolio from disk or create new."""
         if self.portfolio_path.exists():
             try:
-                data = json.loads(self.portfolio_path.read_text())
-                return Portfolio(**data)
+                data = json_loads(self.portfolio_path.read_bytes())
+                if not self.strict_load and _is_trusted_portfolio(data):
+                    return _construct_portfolio(data)
+                return Portfolio.model_validate(data)
             except Exception as e:
-                print(f"⚠️  Error loading portfolio: {e}")
+                console.info(f"⚠️  Error loading portfolio: {e}")
         
         return Portfolio()
     
-    def _save_portfolio(self):
-        """Save portfolio to disk."""
+    def _save_portfolio_sync(self):
+        """Serialize the portfolio and swap it into place (runs in a worker thread)."""
+        # Write a temp file and swap it in, so readers never see a half-written portfolio
+        tmp_path = self.portfolio_path.with_suffix(self.portfolio_path.suffix + ".tmp")
+        # Compact: this is rewritten after every trade and every cycle, and only ever machine-read
+        tmp_path.write_text(self.portfolio.model_dump_json(), encoding="utf-8")
+        os.replace(tmp_path, self.portfolio_path)
+    
+    async def _save_portfolio(self):
+        """Save portfolio to disk without blocking the event loop."""
         try:
-            self.portfolio_path.write_text(
-                self.portfolio.model_dump_json(indent=2)
-            )
+            # Serialised: the flusher and API endpoints share the same temp file.
+            # The trade lock keeps trades from mutating the portfolio mid-serialization.
+            async with self._save_lock, self._trade_lock:
+                self._portfolio_dirty.clear()
+                await asyncio.to_thread(self._save_portfolio_sync)
         except Exception as e:
-            print(f"❌ Error saving portfolio: {e}")
+            console.info(f"❌ Error saving portfolio: {e}")
+    
+    async def _portfolio_flusher(self):
+        """Write the portfolio once it is marked dirty, coalescing changes over one interval."""
+        while True:
+            await self._portfolio_dirty.wait()
+            await asyncio.sleep(self.portfolio_save_interval)
+            # Shielded: cancelling the flusher mid-save must not release _save_lock while
+            # the worker thread is still writing the temp file; the save finishes, and
+            # the shutdown or API save that follows waits for the lock
+            await asyncio.shield(self._save_portfolio())
     
-    def _save_trade_history(self, trade: TradeExecution):
-        """Append trade to history file."""
+    async def _save_trade_history(self, trade: TradeExecution):
+        """Append trade to the JSON Lines history file (one trade per line)."""
         try:
-            history = []
-            if self.trades_history_path.exists():
-                history = json.loads(self.trades_history_path.read_text())
-            
-            history.append(trade.model_dump())
-            self.trades_history_path.write_text(json.dumps(history, indent=2))
+            # Appends run in a worker thread so a slow disk never stalls other markets'
+            # analysis; callers hold _trade_lock, which keeps the lines in trade order
+            await asyncio.to_thread(self._append_trade_line, trade.model_dump_json() + "\n")
         except Exception as e:
-            print(f"⚠️  Error saving trade history: {e}")
+            console.info(f"⚠️  Error saving trade history: {e}")
+    
+    def _append_trade_line(self, line: str):
+        if self._history_fp is None:
+            # Line-buffered: each trade reaches the file as one complete line,
+            # so the history endpoint can read it while the agent runs
+            self._history_fp = open(self.trades_history_path, "a", buffering=1, encoding="utf-8")
+        self._history_fp.write(line)
+    
+    def _close_trade_history(self):
+        """Close the trade history file, if it was opened."""
+        if self._history_fp is not None:
+            self._history_fp.close()
+            self._history_fp = None
     
     async def analyze_market(self, market_query: str) -> Optional[CollectiveDecision]:
         """
         Analyze a market using the full multi-agent system.
         4 specialized agents work together to make a decision.
         """
-        logger.info(f"=" * 70)
-        logger.info(f"🎯 INITIATING DEEP MARKET ANALYSIS: {market_query}")
-        logger.info(f"=" * 70)
+        logger.info("=" * 70)
+        logger.info("🎯 INITIATING DEEP MARKET ANALYSIS: %s", market_query)
+        logger.info("=" * 70)
         
         try:
-            print(f"\n🔍 Analyzing market: {market_query}")
-            print(f"   Deploying 4 AI agents...")
+            console.info(f"\n🔍 Analyzing market: {market_query}")
+            console.info(f"   Deploying 4 AI agents...")
             logger.info("🤖 Deploying Multi-Agent Intelligence System")
             logger.info("└─ DataCollector Agent: Web scraping & real-time data extraction")
             logger.info("└─ OddsAnalyzer Agent: Statistical modeling & probability calibration")
@@ -273,32 +648,33 @@ class AutonomousTradingAgent:
             decision = await self.coordinator.make_decision(market_query)
             
             logger.info("✅ Multi-agent consensus algorithm completed successfully")
-            logger.info(f"📊 Collective Intelligence Recommendation: {decision.final_recommendation}")
-            logger.info(f"🎲 Bayesian Confidence Level: {decision.aggregate_confidence:.2%}")
-            logger.info(f"🤝 Inter-Agent Consensus Strength: {decision.consensus_level:.2%}")
-            logger.info(f"👥 Neural Network Nodes Activated: {len(decision.agent_decisions)} specialist agents")
+            logger.info("📊 Collective Intelligence Recommendation: %s", decision.final_recommendation)
+            logger.info("🎲 Bayesian Confidence Level: %.2f%%", decision.aggregate_confidence * 100)
+            logger.info("🤝 Inter-Agent Consensus Strength: %.2f%%", decision.consensus_level * 100)
+            logger.info("👥 Neural Network Nodes Activated: %s specialist agents", len(decision.agent_decisions))
             
-            # Log each agent's decision
-            logger.info("\n📋 INDIVIDUAL AGENT ANALYSIS BREAKDOWN:")
-            for i, agent_dec in enumerate(decision.agent_decisions, 1):
-                logger.info(f"  🔹 Agent {i}: {agent_dec.agent_name}")
-                logger.info(f"    ├─ Recommendation Vector: {agent_dec.recommendation}")
-                logger.info(f"    ├─ Probabilistic Confidence Score: {agent_dec.confidence:.4f} ({agent_dec.confidence:.2%})")
-                logger.info(f"    ├─ Neural Reasoning Path: {agent_dec.reasoning[:200]}...")
-                logger.info(f"    └─ Extracted Feature Signals: {', '.join(agent_dec.key_factors[:3])}")
+            # Log each agent's decision; skipped outright when INFO is off
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("\n📋 INDIVIDUAL AGENT ANALYSIS BREAKDOWN:")
+                for i, agent_dec in enumerate(decision.agent_decisions, 1):
+                    logger.info("  🔹 Agent %s: %s", i, agent_dec.agent_name)
+                    logger.info("    ├─ Recommendation Vector: %s", agent_dec.recommendation)
+                    logger.info("    ├─ Probabilistic Confidence Score: %.4f (%.2f%%)", agent_dec.confidence, agent_dec.confidence * 100)
+                    logger.info("    ├─ Neural Reasoning Path: %s...", agent_dec.reasoning[:200])
+                    logger.info("    └─ Extracted Feature Signals: %s", ", ".join(agent_dec.key_factors[:3]))
             
-            logger.info(f"\n💡 Aggregated Supporting Evidence Matrix:")
-            for factor in decision.supporting_factors[:5]:
-                logger.info(f"   ✓ {factor}")
-            logger.info(f"\n⚠️  Identified Risk Vectors:")
-            for risk in decision.risk_factors[:5]:
-                logger.info(f"   ⚡ {risk}")
+                logger.info("\n💡 Aggregated Supporting Evidence Matrix:")
+                for factor in decision.supporting_factors[:5]:
+                    logger.info("   ✓ %s", factor)
+                logger.info("\n⚠️  Identified Risk Vectors:")
+                for risk in decision.risk_factors[:5]:
+                    logger.info("   ⚡ %s", risk)
             
-            print(f"\n✅ Multi-Agent Analysis Complete:")
-            print(f"   Recommendation: {decision.final_recommendation}")
-            print(f"   Confidence: {decision.aggregate_confidence:.1%}")
-            print(f"   Consensus: {decision.consensus_level:.1%}")
-            print(f"   Agents: {len(decision.agent_decisions)} participated")
+            console.info(f"\n✅ Multi-Agent Analysis Complete:")
+            console.info(f"   Recommendation: {decision.final_recommendation}")
+            console.info(f"   Confidence: {decision.aggregate_confidence:.1%}")
+            console.info(f"   Consensus: {decision.consensus_level:.1%}")
+            console.info(f"   Agents: {len(decision.agent_decisions)} participated")
             
             return decision
             
@@ -317,25 +693,25 @@ class AutonomousTradingAgent:
             logger.info("🔄 Engaging backup heuristic decision engine")
             logger.info("└─ Multi-agent system temporarily offline, switching to monte carlo simulation")
             # print(f"   ⚠️  Falling back to simple analysis...")
-            import random
-            
-            recommendation = random.choice(["BUY", "SELL", "HOLD"])
-            confidence = random.uniform(0.70, 0.95)
+            recommendation = self._rng.choice(["BUY", "SELL", "HOLD"])
+            confidence = self._rng.uniform(0.70, 0.95)
             
-            logger.info(f"🎲 Stochastic Analysis Output: {recommendation}")
-            logger.info(f"📊 Simulated Confidence Distribution: {confidence:.4f} ({confidence:.2%})")
-            logger.info(f"⚙️  Backup algorithm utilizing randomized decision tree with weighted probabilities")
+            logger.info("🎲 Stochastic Analysis Output: %s", recommendation)
+            logger.info("📊 Simulated Confidence Distribution: %.4f (%.2f%%)", confidence, confidence * 100)
+            logger.info("⚙️  Backup algorithm utilizing randomized decision tree with weighted probabilities")
             
-            agent_decision = AgentDecision(
+            now_iso = _now_iso()
+            # Every value here is generated in-process, so skip validation
+            agent_decision = AgentDecision.model_construct(
                 agent_name="fallback_agent",
                 recommendation=recommendation,
                 confidence=confidence,
                 reasoning=f"Fallback {recommendation} decision (multi-agent failed)",
                 key_factors=["Fallback mode"],
-                timestamp=datetime.now().isoformat()
+                timestamp=now_iso
             )
             
-            decision = CollectiveDecision(
+            decision = CollectiveDecision.model_construct(
                 market_title=market_query,
                 market_url=f"https://polymarket.com/event/{market_query.lower().replace(' ', '-')}",
                 agent_decisions=[agent_decision],
@@ -345,7 +721,8 @@ class AutonomousTradingAgent:
                 supporting_factors=["Fallback analysis"],
                 risk_factors=["Multi-agent system unavailable"],
                 suggested_bet_size=100.0,
-                expected_value=confidence * 100 if recommendation == "BUY" else 0
+                expected_value=confidence * 100 if recommendation == "BUY" else 0,
+                timestamp=now_iso
             )
             
             return decision
@@ -353,12 +730,24 @@ class AutonomousTradingAgent:
     async def discover_trading_opportunities(self) -> List[PolymarketMarket]:
         """
         Discover new trading opportunities.
-        SIMPLIFIED: Use known high-volume markets for now to speed things up.
+        
+        Lists the top active markets from Polymarket's Gamma API; if that fails
+        (or the agent isn't running), falls back to known high-volume markets.
         """
-        print(f"\n🔍 Scouting for trading opportunities...")
+        console.info(f"\n🔍 Scouting for trading opportunities...")
         
-        # SIMPLIFIED: Use pre-defined popular markets (based on what browser found)
-        # This makes the pipeline fast so we can see trades execute
+        if self._http is not None:
+            try:
+                markets = await fetch_gamma_markets(self._http, limit=self.discovery_limit)
+            except httpx.HTTPError as e:
+                logger.warning("⚠️  Gamma API discovery failed (%s), using known markets", e)
+            else:
+                if markets:
+                    console.info(f"\n📊 Found {len(markets)} markets via Gamma API")
+                    self.discovered_markets = markets
+                    return markets
+        
+        # Fallback: pre-defined popular markets (based on what browser found)
         simple_markets = [
             PolymarketMarket(
                 title="Super Bowl Champion 2026",
@@ -386,10 +775,10 @@ class AutonomousTradingAgent:
             ),
         ]
         
-        print(f"\n📊 Found {len(simple_markets)} markets:")
+        console.info(f"\n📊 Found {len(simple_markets)} markets:")
         for market in simple_markets:
-            print(f"   • {market.title}")
-            print(f"     YES: {market.yes_price:.2f} | NO: {market.no_price:.2f} | Vol: {market.volume}")
+            console.info(f"   • {market.title}")
+            console.info(f"     YES: {market.yes_price:.2f} | NO: {market.no_price:.2f} | Vol: {market.volume}")
         
         self.discovered_markets = simple_markets
         return simple_markets
@@ -398,45 +787,45 @@ class AutonomousTradingAgent:
         """
         SIMPLE logic: Trade if agents say BUY/SELL with any confidence > 20%.
         """
-        logger.info(f"\n{'='*60}")
-        logger.info(f"⚖️  EXECUTING RISK-REWARD OPTIMIZATION ALGORITHM")
-        logger.info(f"Target Market: {market.title}")
-        logger.info(f"{'='*60}")
-        logger.info(f"🧠 Collective Agent Recommendation Vector: {decision.final_recommendation}")
-        logger.info(f"📈 Aggregated Bayesian Confidence Score: {decision.aggregate_confidence:.4f} ({decision.aggregate_confidence:.2%})")
-        logger.info(f"💰 Available Capital Buffer: ${self.portfolio.cash:.2f}")
-        logger.info(f"🎯 Analyzing Kelly Criterion and position sizing constraints...")
-        
-        print(f"\n🎯 Trade Decision for {market.title}:")
-        print(f"   Agent says: {decision.final_recommendation}")
-        print(f"   Confidence: {decision.aggregate_confidence:.1%}")
+        logger.info("\n%s", "=" * 60)
+        logger.info("⚖️  EXECUTING RISK-REWARD OPTIMIZATION ALGORITHM")
+        logger.info("Target Market: %s", market.title)
+        logger.info("%s", "=" * 60)
+        logger.info("🧠 Collective Agent Recommendation Vector: %s", decision.final_recommendation)
+        logger.info("📈 Aggregated Bayesian Confidence Score: %.4f (%.2f%%)", decision.aggregate_confidence, decision.aggregate_confidence * 100)
+        logger.info("💰 Available Capital Buffer: $%.2f", self.portfolio.cash)
+        logger.info("🎯 Analyzing Kelly Criterion and position sizing constraints...")
+        
+        console.info(f"\n🎯 Trade Decision for {market.title}:")
+        console.info(f"   Agent says: {decision.final_recommendation}")
+        console.info(f"   Confidence: {decision.aggregate_confidence:.1%}")
         
         # Skip HOLD
         if decision.final_recommendation == "HOLD":
             logger.info("🚫 TRADE REJECTION: Neutral market signal detected")
             logger.info("└─ Multi-agent consensus indicates insufficient edge for position entry")
-            print(f"   → SKIP (agents say hold)")
+            console.info(f"   → SKIP (agents say hold)")
             return False
         
         # Simple threshold: any confidence > 20%
         if decision.aggregate_confidence < 0.20:
-            logger.info(f"🚫 TRADE REJECTION: Confidence threshold breach")
-            logger.info(f"└─ Signal strength {decision.aggregate_confidence:.4f} below minimum threshold 0.20")
-            logger.info(f"└─ Risk management protocol: Insufficient statistical significance")
-            print(f"   → SKIP (confidence too low)")
+            logger.info("🚫 TRADE REJECTION: Confidence threshold breach")
+            logger.info("└─ Signal strength %.4f below minimum threshold 0.20", decision.aggregate_confidence)
+            logger.info("└─ Risk management protocol: Insufficient statistical significance")
+            console.info(f"   → SKIP (confidence too low)")
             return False
         
         # Check we have cash
         if self.portfolio.cash < 50:
-            logger.info(f"🚫 TRADE REJECTION: Capital constraint violation")
-            logger.info(f"└─ Available liquidity ${self.portfolio.cash:.2f} below minimum position requirement $50.00")
-            logger.info(f"└─ Portfolio protection: Preserving capital reserves")
-            print(f"   → SKIP (not enough cash: ${self.portfolio.cash:.2f})")
+            logger.info("🚫 TRADE REJECTION: Capital constraint violation")
+            logger.info("└─ Available liquidity $%.2f below minimum position requirement $50.00", self.portfolio.cash)
+            logger.info("└─ Portfolio protection: Preserving capital reserves")
+            console.info(f"   → SKIP (not enough cash: ${self.portfolio.cash:.2f})")
             return False
         
         logger.info("✅ TRADE APPROVAL: All risk parameters satisfied")
         logger.info("└─ Initiating position entry sequence...")
-        print(f"   → ✅ EXECUTE TRADE!")
+        console.info(f"   → ✅ EXECUTE TRADE!")
         return True
     
     async def execute_trade(
@@ -450,9 +839,9 @@ class AutonomousTradingAgent:
             return None
         
         try:
-            logger.info(f"\n{'*'*60}")
-            logger.info(f"💎 INITIATING AUTONOMOUS TRADE EXECUTION PROTOCOL")
-            logger.info(f"{'*'*60}")
+            logger.info("\n%s", "*" * 60)
+            logger.info("💎 INITIATING AUTONOMOUS TRADE EXECUTION PROTOCOL")
+            logger.info("%s", "*" * 60)
             
             # Map YES/NO to BUY/SELL
             if decision.final_recommendation == "YES":
@@ -467,25 +856,28 @@ class AutonomousTradingAgent:
             price = market.yes_price
             
             # Dynamic position sizing: Random between $100 and $800, capped by available cash
-            import random
-            base_size = random.uniform(100, 800)
-            size = min(base_size, self.portfolio.cash * 0.8, self.max_position_size)
+            base_size = self._rng.uniform(100, 800)
+            size = _cents(min(base_size, self.portfolio.cash * 0.8, self.max_position_size))
             shares = size / price if price > 0 else 0
             
-            logger.info(f"📊 Optimized Position Parameters:")
-            logger.info(f"  └─ Target Market: {market.title}")
-            logger.info(f"  └─ Strategic Action: {action.upper()} ({decision.final_recommendation})")
-            logger.info(f"  └─ Outcome Vector: {outcome}")
-            logger.info(f"  └─ Entry Price Point: ${price:.6f} (probability: {price:.2%})")
-            logger.info(f"  └─ Kelly-Optimized Position Size: ${size:.2f}")
-            logger.info(f"  └─ Share Allocation: {shares:.4f} contracts")
-            logger.info(f"  └─ Multi-Agent Confidence Score: {decision.aggregate_confidence:.4f} ({decision.aggregate_confidence:.2%})")
-            logger.info(f"  └─ Inter-Agent Consensus Metric: {decision.consensus_level:.4f} ({decision.consensus_level:.2%})")
-            logger.info(f"🧮 Calculating expected value and risk-adjusted returns...")
+            logger.info("📊 Optimized Position Parameters:")
+            logger.info("  └─ Target Market: %s", market.title)
+            logger.info("  └─ Strategic Action: %s (%s)", action.upper(), decision.final_recommendation)
+            logger.info("  └─ Outcome Vector: %s", outcome)
+            logger.info("  └─ Entry Price Point: $%.6f (probability: %.2f%%)", price, price * 100)
+            logger.info("  └─ Kelly-Optimized Position Size: $%.2f", size)
+            logger.info("  └─ Share Allocation: %.4f contracts", shares)
+            logger.info("  └─ Multi-Agent Confidence Score: %.4f (%.2f%%)", decision.aggregate_confidence, decision.aggregate_confidence * 100)
+            logger.info("  └─ Inter-Agent Consensus Metric: %.4f (%.2f%%)", decision.consensus_level, decision.consensus_level * 100)
+            logger.info("🧮 Calculating expected value and risk-adjusted returns...")
             
-            # Create trade
-            trade = TradeExecution(
-                trade_id=f"trade_{datetime.now().strftime('%Y%m%d_%H%M%S')}",
+            # Create trade; one clock read stamps the id, the trade and the portfolio.
+            # Every field is computed right here, so skip validation (loaded portfolios
+            # still go through model_validate)
+            now = datetime.now()
+            now_iso = now.isoformat()
+            trade = TradeExecution.model_construct(
+                trade_id=f"trade_{now.strftime('%Y%m%d_%H%M%S_%f')}",
                 market_id=market.url or market.title.lower().replace(" ", "-"),
                 market_title=market.title,
                 action=action,
@@ -495,63 +887,188 @@ class AutonomousTradingAgent:
                 shares=shares,
                 confidence=decision.aggregate_confidence,
                 consensus=decision.consensus_level,
-                agent_votes={
-                    agent_dec.agent_name: agent_dec.recommendation 
-                    for agent_dec in decision.agent_decisions
-                },
-                executed_at=datetime.now().isoformat(),
+                agent_votes=decision.agent_votes,
+                executed_at=now_iso,
             )
             
-            logger.info(f"\n🗳️  Democratic Voting Results:")
-            for agent_name, vote in trade.agent_votes.items():
-                logger.info(f"  └─ {agent_name}: {vote}")
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("\n🗳️  Democratic Voting Results:")
+                for agent_name, vote in trade.agent_votes.items():
+                    logger.info("  └─ %s: %s", agent_name, vote)
             
             # Update portfolio
-            logger.info(f"\n💼 Portfolio State Transition:")
-            logger.info(f"  ├─ Pre-Trade Capital: ${self.portfolio.cash:.2f}")
-            self.portfolio.add_trade(trade)
-            logger.info(f"  ├─ Post-Trade Capital: ${self.portfolio.cash:.2f}")
-            logger.info(f"  ├─ Capital Deployed: ${size:.2f}")
-            logger.info(f"  └─ Active Portfolio Positions: {len(self.portfolio.active_positions)}")
+            logger.info("\n💼 Portfolio State Transition:")
+            logger.info("  ├─ Pre-Trade Capital: $%.2f", self.portfolio.cash)
+            self.portfolio.add_trade(trade, now_iso=now_iso)
+            logger.info("  ├─ Post-Trade Capital: $%.2f", self.portfolio.cash)
+            logger.info("  ├─ Capital Deployed: $%.2f", size)
+            logger.info("  └─ Active Portfolio Positions: %s", len(self.portfolio.active_positions))
             
-            logger.info(f"\n💾 Persisting transaction to distributed ledger...")
-            self._save_portfolio()
-            self._save_trade_history(trade)
+            logger.info("\n💾 Persisting transaction to distributed ledger...")
+            self._portfolio_dirty.set()
+            await self._save_trade_history(trade)
             
-            logger.info(f"\n✅ TRADE EXECUTION COMPLETE - TRANSACTION CONFIRMED")
-            logger.info(f"Transaction Hash: {trade.trade_id}")
-            logger.info(f"Execution timestamp: {trade.executed_at}")
-            logger.info(f"Expected ROI (probabilistic): {(1/price - 1) * decision.aggregate_confidence:.2%}")
+            logger.info("\n✅ TRADE EXECUTION COMPLETE - TRANSACTION CONFIRMED")
+            logger.info("Transaction Hash: %s", trade.trade_id)
+            logger.info("Execution timestamp: %s", trade.executed_at)
+            logger.info("Expected ROI (probabilistic): %.2f%%", (1/price - 1) * decision.aggregate_confidence * 100)
             
-            print(f"\n💰 TRADE EXECUTED:")
-            print(f"   Market: {market.title}")
-            print(f"   Action: {action.upper()} {outcome}")
-            print(f"   Size: ${size:.2f} ({shares:.2f} shares @ ${price:.2f})")
-            print(f"   Remaining Cash: ${self.portfolio.cash:.2f}")
+            console.info(f"\n💰 TRADE EXECUTED:")
+            console.info(f"   Market: {market.title}")
+            console.info(f"   Action: {action.upper()} {outcome}")
+            console.info(f"   Size: ${size:.2f} ({shares:.2f} shares @ ${price:.2f})")
+            console.info(f"   Remaining Cash: ${self.portfolio.cash:.2f}")
             
             return trade
             
         except Exception as e:
-            logger.error(f"❌ ERROR executing trade: {e}")
-            logger.error(f"Exception type: {type(e).__name__}")
-            import traceback
-            logger.error(f"Traceback: {traceback.format_exc()}")
-            
-            print(f"❌ Error executing trade: {e}")
-            traceback.print_exc()
+            # Traceback goes to the thoughts log and stderr, rate-limited per exception type
+            logger.exception("❌ ERROR executing trade: %s", e)
+            console.info(f"❌ Error executing trade: {e}")
             return None
     
+    @staticmethod
+    def _market_key(market: PolymarketMarket) -> str:
+        return market.url or market.title
+    
+    def _is_market_due(self, market: PolymarketMarket, now: float) -> bool:
+        """Whether a discovered market's backoff has expired."""
+        return self._market_next_check.get(self._market_key(market), 0.0) <= now
+    
+    def _schedule_next_check(self, market: PolymarketMarket, now: float):
+        """
+        Back off polling for markets whose price isn't moving.
+        
+        A move under 1% doubles the market's interval (capped at max_idle_interval),
+        a move of 5% or more resets it to check_interval.
+        """
+        key = self._market_key(market)
+        interval = self._market_interval.get(key, self.check_interval)
+        last_price = self._last_prices.get(key)
+        if last_price is not None:
+            delta = abs(market.yes_price - last_price)
+            if delta < 0.01:
+                interval = min(interval * 2, self.max_idle_interval)
+            elif delta >= 0.05:
+                interval = self.check_interval
+        self._last_prices[key] = market.yes_price
+        self._market_interval[key] = interval
+        self._market_next_check[key] = now + interval
+        self.last_analysis[key] = now
+    
+    def _forget_stale_markets(self, now: float):
+        """Drop the schedule of markets not analysed within _MARKET_STATE_TTL."""
+        stale = [key for key, analysed in self.last_analysis.items() if now - analysed > _MARKET_STATE_TTL]
+        for key in stale:
+            del self.last_analysis[key]
+            self._last_prices.pop(key, None)
+            self._market_interval.pop(key, None)
+            self._market_next_check.pop(key, None)
+    
+    def _watch_prices(self, markets: List[PolymarketMarket]):
+        """(Re)subscribe the price stream when the set of streamable markets changes."""
+        if websockets is None:
+            return
+        markets_by_token = {market.token_id: market for market in markets if market.token_id}
+        if markets_by_token.keys() == self._markets_by_token.keys():
+            # Same subscription; just point it at this cycle's market objects
+            self._markets_by_token = markets_by_token
+            return
+        self._markets_by_token = markets_by_token
+        if self._price_stream is not None:
+            self._price_stream.cancel()
+            self._price_stream = None
+        if markets_by_token:
+            self._price_stream = asyncio.create_task(self._stream_prices(list(markets_by_token)))
+    
+    async def _stream_prices(self, token_ids: List[str]):
+        """Follow CLOB price updates for token_ids, reconnecting after errors."""
+        while self.running:
+            try:
+                async with websockets.connect(CLOB_MARKET_WS_URL) as ws:
+                    await ws.send(json_dumps({"assets_ids": token_ids, "type": "market"}))
+                    async for message in ws:
+                        events = json_loads(message)
+                        for event in events if isinstance(events, list) else [events]:
+                            self._on_price_event(event)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning("⚠️  Price stream interrupted (%s), reconnecting in 5s", e)
+                await asyncio.sleep(5)
+    
+    def _on_price_event(self, event: Dict[str, Any]):
+        """Apply one CLOB market-channel event; only trade and price-change events carry prices."""
+        event_type = event.get("event_type")
+        if event_type == "last_trade_price":
+            updates = [event]
+        elif event_type == "price_change":
+            updates = event.get("price_changes") or [event]
+        else:
+            return
+        for update in updates:
+            market = self._markets_by_token.get(update.get("asset_id"))
+            if market is None:
+                continue
+            # Prefer the quoted midpoint; a price_change's own price is just the level that changed
+            if update.get("best_bid") and update.get("best_ask"):
+                market.yes_price = (float(update["best_bid"]) + float(update["best_ask"])) / 2
+            elif update.get("price") is not None:
+                market.yes_price = float(update["price"])
+            else:
+                continue
+            last_price = self._last_prices.get(self._market_key(market))
+            if last_price is not None and abs(market.yes_price - last_price) >= 0.05:
+                # Material move since the last analysis: analyse on the next cycle, and start it now
+                self._market_next_check[self._market_key(market)] = 0.0
+                self._wake.set()
+    
+    async def _sleep_until_next_cycle(self):
+        """
+        Sleep check_interval seconds, or until the price stream flags a material move.
+        
+        _wake is cleared when a cycle starts, not here, so a move or a stop() that
+        arrives while the cycle is still analysing ends this sleep at once.
+        """
+        if not self.running:
+            return
+        try:
+            await asyncio.wait_for(self._wake.wait(), timeout=self.check_interval)
+            if not self.running:
+                return
+            logger.info("⚡ Price move detected on a watched market, starting the next cycle early")
+        except asyncio.TimeoutError:
+            pass
+    
     async def analyze_and_trade_market(self, market: PolymarketMarket):
         """Analyze a discovered market and potentially execute a trade."""
         
-        # Analyze market using multi-agent system
-        decision = await self.analyze_market(market.title)
+        # Only the analysis holds a slot: a market waiting for the trade lock
+        # doesn't keep the next market from being analysed
+        async with self._analysis_sem:
+            if not self.running:
+                logger.info("🛑 System shutdown signal received, skipping remaining markets")
+                return
+            logger.info("\n━━━ Processing Market ━━━")
+            logger.info("Target: %s", market.title)
+            
+            cache_key = (self._market_key(market), round(market.yes_price, 2))
+            cached = self._analysis_cache.get(cache_key)
+            if cached is not None and time.monotonic() - cached[0] < self.analysis_cache_ttl:
+                logger.info("♻️  Price unchanged since a recent analysis, reusing its decision")
+                decision = cached[1]
+            else:
+                # Analyze market using multi-agent system
+                decision = await self.analyze_market(market.title)
+                if decision:
+                    self._analysis_cache[cache_key] = (time.monotonic(), decision)
         
         if not decision:
             return
         
         # Execute trade if criteria met
-        await self.execute_trade(decision, market)
+        async with self._trade_lock:
+            await self.execute_trade(decision, market)
     
     async def monitoring_loop(self):
         """Main loop: Discover markets from Polymarket → Analyze → Trade."""
@@ -559,25 +1076,27 @@ class AutonomousTradingAgent:
         logger.info("\n" + "="*70)
         logger.info("🚀 AUTONOMOUS MULTI-AGENT TRADING SYSTEM INITIALIZED")
         logger.info("="*70)
-        logger.info(f"💰 Portfolio Valuation: ${self.portfolio.total_value:.2f}")
-        logger.info(f"💵 Liquid Capital Available: ${self.portfolio.cash:.2f}")
-        logger.info(f"📊 Open Positions in Portfolio: {len(self.portfolio.active_positions)}")
-        logger.info(f"⏱️  Market Scanning Frequency: {self.check_interval}s")
-        logger.info(f"📏 Maximum Single Position Size: ${self.max_position_size:.2f}")
-        logger.info(f"🎯 Minimum Confidence Threshold: {self.min_confidence:.2%}")
-        logger.info(f"🤝 Minimum Consensus Requirement: {self.min_consensus:.2%}")
-        logger.info(f"🧠 Neural Architecture: 4-agent distributed decision network")
-        logger.info(f"⚙️  Risk Management: Kelly Criterion with volatility adjustment")
-        
-        print("\n🤖 Autonomous Trading Agent Started")
-        print(f"📊 Portfolio: ${self.portfolio.total_value:.2f} (Cash: ${self.portfolio.cash:.2f})")
-        print(f"⏱️  Check interval: {self.check_interval}s")
-        print(f" Max position: ${self.max_position_size:.2f}")
-        print("\n" + "="*60 + "\n")
+        logger.info("💰 Portfolio Valuation: $%.2f", self.portfolio.total_value)
+        logger.info("💵 Liquid Capital Available: $%.2f", self.portfolio.cash)
+        logger.info("📊 Open Positions in Portfolio: %s", len(self.portfolio.active_positions))
+        logger.info("⏱️  Market Scanning Frequency: %ss", self.check_interval)
+        logger.info("📏 Maximum Single Position Size: $%.2f", self.max_position_size)
+        logger.info("🎯 Minimum Confidence Threshold: %.2f%%", self.min_confidence * 100)
+        logger.info("🤝 Minimum Consensus Requirement: %.2f%%", self.min_consensus * 100)
+        logger.info("🧠 Neural Architecture: 4-agent distributed decision network")
+        logger.info("⚙️  Risk Management: Kelly Criterion with volatility adjustment")
+        
+        console.info("\n🤖 Autonomous Trading Agent Started")
+        console.info(f"📊 Portfolio: ${self.portfolio.total_value:.2f} (Cash: ${self.portfolio.cash:.2f})")
+        console.info(f"⏱️  Check interval: {self.check_interval}s")
+        console.info(f" Max position: ${self.max_position_size:.2f}")
+        console.info("\n" + "="*60 + "\n")
         
         self.running = True
         
         while self.running:
+            # Wake-ups from here on (price moves, stop()) end this cycle's sleep
+            self._wake.clear()
             try:
                 logger.info("\n" + "-"*70)
                 logger.info("🔄 INITIATING NEW MARKET ANALYSIS CYCLE")
@@ -591,85 +1110,117 @@ class AutonomousTradingAgent:
                 if not discovered_markets:
                     logger.warning("⚠️  Market scanner returned zero viable opportunities")
                     logger.info("└─ Entering standby mode, re-scanning in next cycle")
-                    print(f"⚠️  No markets discovered, waiting...")
-                    await asyncio.sleep(self.check_interval)
+                    console.info(f"⚠️  No markets discovered, waiting...")
+                    await self._sleep_until_next_cycle()
                     continue
                 
-                logger.info(f"✅ Market Discovery Complete: {len(discovered_markets)} high-potential markets identified")
+                logger.info("✅ Market Discovery Complete: %s high-potential markets identified", len(discovered_markets))
                 for idx, mkt in enumerate(discovered_markets, 1):
-                    logger.info(f"  {idx}. {mkt.title} (Vol: {mkt.volume}, Price: {mkt.yes_price:.3f})")
+                    logger.info("  %s. %s (Vol: %s, Price: %.3f)", idx, mkt.title, mkt.volume, mkt.yes_price)
+                self._watch_prices(discovered_markets)
+                
+                # Skip quiet markets that are still backing off
+                now = time.monotonic()
+                self._analysis_cache = {
+                    key: entry for key, entry in self._analysis_cache.items()
+                    if now - entry[0] < self.analysis_cache_ttl
+                }
+                self._forget_stale_markets(now)
+                due_markets = [mkt for mkt in discovered_markets if self._is_market_due(mkt, now)]
+                if len(due_markets) < len(discovered_markets):
+                    logger.info("└─ %s quiet markets backed off until a later cycle", len(discovered_markets) - len(due_markets))
+                discovered_markets = due_markets
                 
                 # Step 2: Analyze each market and trade if agents approve
-                logger.info(f"\n🧠 Phase 2: Multi-Agent Deep Analysis Pipeline")
-                logger.info(f"└─ Deploying 4 specialized AI agents across {len(discovered_markets)} markets...")
-                print(f"\n🔄 Analyzing {len(discovered_markets)} markets...")
-                for i, market in enumerate(discovered_markets, 1):
-                    if not self.running:
-                        logger.info("🛑 System shutdown signal received, terminating analysis pipeline")
-                        break
-                    
-                    logger.info(f"\n━━━ Processing Market {i}/{len(discovered_markets)} ━━━")
-                    logger.info(f"Target: {market.title}")
+                logger.info("\n🧠 Phase 2: Multi-Agent Deep Analysis Pipeline")
+                logger.info("└─ Deploying 4 specialized AI agents across %s markets...", len(discovered_markets))
+                console.info(f"\n🔄 Analyzing {len(discovered_markets)} markets...")
+                # Analyses are independent I/O-bound pipelines: run them side by side,
+                # bounded by _analysis_sem instead of a fixed cooldown between markets
+                async def process_market(market: PolymarketMarket):
                     await self.analyze_and_trade_market(market)
-                    
-                    # Small delay between markets
-                    logger.info(f"⏸️  Inter-market cooldown period (5s)...")
-                    await asyncio.sleep(5)
+                    self._schedule_next_check(market, time.monotonic())
+                
+                # One market failing must not abandon the others mid-analysis
+                results = await asyncio.gather(
+                    *(process_market(market) for market in discovered_markets),
+                    return_exceptions=True,
+                )
+                for market, result in zip(discovered_markets, results):
+                    if isinstance(result, Exception):
+                        logger.error(
+                            "❌ ERROR analyzing %s: %s", market.title, result,
+                            exc_info=(type(result), result, result.__traceback__),
+                        )
                 
                 # Step 3: Update portfolio
                 logger.info("\n💼 Phase 3: Portfolio Reconciliation & Risk Assessment")
                 logger.info("└─ Recalculating total asset valuation...")
-                self.portfolio.update_total_value()
-                self._save_portfolio()
+                now = datetime.now()
+                self.portfolio.update_total_value(now_iso=now.isoformat())
+                self._portfolio_dirty.set()
                 
                 pnl_indicator = "📈" if self.portfolio.total_pnl >= 0 else "📉"
-                logger.info(f"\n{pnl_indicator} Portfolio Performance Metrics:")
-                logger.info(f"  ├─ Total Asset Value: ${self.portfolio.total_value:.2f}")
-                logger.info(f"  ├─ Available Liquidity: ${self.portfolio.cash:.2f}")
-                logger.info(f"  ├─ Active Market Positions: {len(self.portfolio.active_positions)}")
-                logger.info(f"  ├─ Realized + Unrealized P&L: ${self.portfolio.total_pnl:+.2f}")
-                logger.info(f"  └─ Portfolio ROI: {(self.portfolio.total_pnl / 10000 * 100):+.2f}%")
+                logger.info("\n%s Portfolio Performance Metrics:", pnl_indicator)
+                logger.info("  ├─ Total Asset Value: $%.2f", self.portfolio.total_value)
+                logger.info("  ├─ Available Liquidity: $%.2f", self.portfolio.cash)
+                logger.info("  ├─ Active Market Positions: %s", len(self.portfolio.active_positions))
+                logger.info("  ├─ Realized + Unrealized P&L: $%+.2f", self.portfolio.total_pnl)
+                logger.info("  └─ Portfolio ROI: %+.2f%%", self.portfolio.total_pnl / 10000 * 100)
                 
-                print(f"\n📊 Portfolio Status:")
-                print(f"   Total Value: ${self.portfolio.total_value:.2f}")
-                print(f"   Cash: ${self.portfolio.cash:.2f}")
-                print(f"   Positions: {len(self.portfolio.active_positions)}")
-                print(f"   Total P&L: ${self.portfolio.total_pnl:.2f}")
+                console.info(f"\n📊 Portfolio Status:")
+                console.info(f"   Total Value: ${self.portfolio.total_value:.2f}")
+                console.info(f"   Cash: ${self.portfolio.cash:.2f}")
+                console.info(f"   Positions: {len(self.portfolio.active_positions)}")
+                console.info(f"   Total P&L: ${self.portfolio.total_pnl:.2f}")
                 
                 # Wait for next cycle
-                logger.info(f"\n⏳ Market analysis cycle complete")
-                logger.info(f"└─ Entering sleep mode for {self.check_interval}s before next scan...")
-                logger.info(f"└─ System time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-                print(f"\n⏳ Next check in {self.check_interval}s...")
-                await asyncio.sleep(self.check_interval)
+                logger.info("\n⏳ Market analysis cycle complete")
+                logger.info("└─ Entering sleep mode for %ss before next scan...", self.check_interval)
+                logger.info("└─ System time: %s", now.strftime('%Y-%m-%d %H:%M:%S'))
+                console.info(f"\n⏳ Next check in {self.check_interval}s...")
+                await self._sleep_until_next_cycle()
                 
             except KeyboardInterrupt:
                 logger.info("KeyboardInterrupt received - stopping agent")
-                print("\n⚠️  Stopping...")
+                console.info("\n⚠️  Stopping...")
                 self.running = False
                 break
             except Exception as e:
-                logger.error(f"ERROR in monitoring loop: {e}")
-                logger.error(f"Exception type: {type(e).__name__}")
-                import traceback
-                logger.error(f"Traceback: {traceback.format_exc()}")
-                
-                print(f"❌ Error in loop: {e}")
-                traceback.print_exc()
+                logger.exception("ERROR in monitoring loop: %s", e)
+                console.info(f"❌ Error in loop: {e}")
                 await asyncio.sleep(60)
         
         logger.info("Agent stopped")
-        logger.info(f"Final Portfolio Value: ${self.portfolio.total_value:.2f}")
-        print("\n✅ Agent stopped")
-        print(f"📊 Final Portfolio: ${self.portfolio.total_value:.2f}")
+        logger.info("Final Portfolio Value: $%.2f", self.portfolio.total_value)
+        console.info("\n✅ Agent stopped")
+        console.info(f"📊 Final Portfolio: ${self.portfolio.total_value:.2f}")
     
     async def start(self):
         """Start the autonomous trading agent."""
-        await self.monitoring_loop()
+        self._http = httpx.AsyncClient(
+            timeout=10.0,
+            limits=httpx.Limits(max_connections=16, keepalive_expiry=30.0),
+        )
+        flusher = asyncio.create_task(self._portfolio_flusher())
+        try:
+            await self.monitoring_loop()
+        finally:
+            flusher.cancel()
+            if self._price_stream is not None:
+                self._price_stream.cancel()
+                self._price_stream = None
+            self._markets_by_token = {}
+            await self._http.aclose()
+            self._http = None
+            if self._portfolio_dirty.is_set():
+                await self._save_portfolio()
+            self._close_trade_history()
     
     def stop(self):
         """Stop the agent."""
         self.running = False
+        self._wake.set()
 
 
 async def main():
@@ -706,6 +1257,11 @@ async def main():
         default=500.0,
         help="Maximum position size in USD (default: 500)"
     )
+    parser.add_argument(
+        "--strict-load",
+        action="store_true",
+        help="Fully validate the saved portfolio on startup instead of trusting its shape"
+    )
     
     args = parser.parse_args()
     
@@ -716,10 +1272,16 @@ async def main():
         min_confidence=args.min_confidence,
         min_consensus=args.min_consensus,
         max_position_size=args.max_position,
+        strict_load=args.strict_load,
     )
     
     await agent.start()
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    try:
+        import uvloop
+    except ImportError:
+        asyncio.run(main())
+    else:
+        uvloop.run(main())
@@ -19,6 +19,7 @@ Endpoints:
 
 import asyncio
 import os
+import traceback
 from typing import Optional
 from dotenv import load_dotenv
 from fastapi import FastAPI, HTTPException
@@ -33,6 +34,12 @@ load_dotenv(env_path)
 import sys
 backend_dir = os.path.dirname(os.path.abspath(__file__))
 sys.path.insert(0, backend_dir)
+# Polymarket collector and shared JSON helpers; registered once rather than per request
+polymarket_agent_dir = os.path.join(backend_dir, "Polymarket Agent")
+if polymarket_agent_dir not in sys.path:
+    sys.path.insert(0, polymarket_agent_dir)
+
+from polymarket_json import json_loads
 
 try:
     from browser_use import Agent, Browser
@@ -244,7 +251,6 @@ async def collect_polymarket_data(
     """
     try:
         # Import the Polymarket collector
-        sys.path.insert(0, os.path.join(os.path.dirname(__file__), "Polymarket Agent"))
         from polymarket_collector import collect_market_data
         
         # Determine method and identifier
@@ -362,7 +368,6 @@ async def analyze_market_with_agents(request: dict):
         
     except Exception as e:
         print(f"Error in multi-agent analysis: {str(e)}")
-        import traceback
         traceback.print_exc()
         raise HTTPException(
             status_code=500,
@@ -435,7 +440,6 @@ async def start_autonomous_trading(config: AgentConfig = None):
         
     except Exception as e:
         print(f"Error starting agent: {str(e)}")
-        import traceback
         traceback.print_exc()
         raise HTTPException(
             status_code=500,
@@ -486,6 +490,7 @@ async def get_trading_status():
     return {
         "running": autonomous_agent.running,
         "portfolio": autonomous_agent.portfolio.dict(),
+        "closed_stats": autonomous_agent.portfolio.aggregate_stats(),
         "markets_monitored": autonomous_agent.markets_to_monitor,
         "config": {
             "check_interval": autonomous_agent.check_interval,
@@ -504,11 +509,10 @@ async def get_portfolio():
     if not autonomous_agent:
         # Load from disk
         from pathlib import Path
-        import json
         
         portfolio_path = Path("data/portfolio.json")
         if portfolio_path.exists():
-            return json.loads(portfolio_path.read_text())
+            return json_loads(await asyncio.to_thread(portfolio_path.read_bytes))
         else:
             return {
                 "total_value": 10000.0,
@@ -532,11 +536,10 @@ async def get_active_positions():
     
     if not autonomous_agent:
         from pathlib import Path
-        import json
         
         portfolio_path = Path("data/portfolio.json")
         if portfolio_path.exists():
-            portfolio = json.loads(portfolio_path.read_text())
+            portfolio = json_loads(await asyncio.to_thread(portfolio_path.read_bytes))
             return {"positions": portfolio.get("active_positions", [])}
         return {"positions": []}
     
@@ -547,13 +550,13 @@ async def get_active_positions():
 async def get_trade_history():
     """Get complete trade history."""
     from pathlib import Path
-    import json
     
-    history_path = Path("data/trades_history.json")
+    history_path = Path("data/trades_history.jsonl")
     if history_path.exists():
-        trades = json.loads(history_path.read_text())
-        # Return array directly for frontend compatibility
-        return trades
+        # One trade per line; return array directly for frontend compatibility.
+        # Read off the event loop, which the running agent shares with this endpoint.
+        data = await asyncio.to_thread(history_path.read_bytes)
+        return [json_loads(line) for line in data.splitlines() if line.strip()]
     
     return []
 
@@ -574,8 +577,11 @@ async def close_position(trade_id: str, final_price: float, resolved_outcome: st
         )
     
     try:
-        autonomous_agent.portfolio.close_trade(trade_id, final_price, resolved_outcome)
-        autonomous_agent._save_portfolio()
+        # Same lock as the agent's trades: _save_portfolio dumps the portfolio in a
+        # worker thread and relies on nothing mutating it meanwhile
+        async with autonomous_agent._trade_lock:
+            autonomous_agent.portfolio.close_trade(trade_id, final_price, resolved_outcome)
+        await autonomous_agent._save_portfolio()
         
         return {
             "success": True,
@@ -605,19 +611,19 @@ async def clear_all_positions():
         )
     
     try:
-        portfolio = autonomous_agent.portfolio
-        positions_closed = len(portfolio.active_positions)
-        
-        # Close all active positions at their entry price (neutral outcome)
-        for position in list(portfolio.active_positions):
-            # Close at entry price for neutral P&L
-            portfolio.close_trade(
-                position.trade_id,
-                position.price,
-                position.outcome  # Assume outcome matched for neutral close
+        async with autonomous_agent._trade_lock:
+            portfolio = autonomous_agent.portfolio
+            positions_closed = len(portfolio.active_positions)
+            
+            # Close all active positions at their entry price (neutral outcome)
+            positions = list(portfolio.active_positions)
+            portfolio.settle_batch(
+                [position.trade_id for position in positions],
+                [position.outcome for position in positions],  # Assume outcome matched for neutral close
+                [position.price for position in positions]
             )
         
-        autonomous_agent._save_portfolio()
+        await autonomous_agent._save_portfolio()
         
         return {
             "success": True,
@@ -647,17 +653,12 @@ async def reset_portfolio():
         )
     
     try:
-        # Reset portfolio to initial state
-        autonomous_agent.portfolio.active_positions = []
-        autonomous_agent.portfolio.closed_positions = []
-        autonomous_agent.portfolio.cash = 10000.0
-        autonomous_agent.portfolio.total_value = 10000.0
-        autonomous_agent.portfolio.total_pnl = 0.0
-        autonomous_agent.portfolio.win_rate = 0.0
-        autonomous_agent.portfolio.total_trades = 0
-        autonomous_agent.portfolio.winning_trades = 0
-        autonomous_agent.portfolio.update_total_value()
-        autonomous_agent._save_portfolio()
+        # Reset portfolio to initial state (a fresh model keeps its position index consistent)
+        from autonomous_trading_agent import Portfolio
+        async with autonomous_agent._trade_lock:
+            autonomous_agent.portfolio = Portfolio()
+            autonomous_agent.portfolio.update_total_value()
+        await autonomous_agent._save_portfolio()
         
         return {
             "success": True,
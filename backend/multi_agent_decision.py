@@ -16,11 +16,21 @@ User requests analysis → Agents run in parallel → Results aggregated → Fin
 """
 
 import asyncio
-from typing import List, Dict, Any
+import os
+import random
+import sys
+import time
+from functools import cached_property
+from typing import List, Dict, Any, Tuple
 from datetime import datetime
 from pydantic import BaseModel, Field
 import json
 
+# polymarket_collector lives in the "Polymarket Agent" directory; register it once
+_POLYMARKET_AGENT_DIR = os.path.join(os.path.dirname(__file__), "Polymarket Agent")
+if _POLYMARKET_AGENT_DIR not in sys.path:
+    sys.path.insert(0, _POLYMARKET_AGENT_DIR)
+
 # ============================================================================
 # Helper Functions
 # ============================================================================
@@ -78,6 +88,11 @@ class CollectiveDecision(BaseModel):
     expected_value: float | None
     
     timestamp: str = Field(default_factory=lambda: datetime.now().isoformat())
+    
+    @cached_property
+    def agent_votes(self) -> Dict[str, str]:
+        """Each agent's recommendation, keyed by agent name (built once per decision)."""
+        return {decision.agent_name: decision.recommendation for decision in self.agent_decisions}
 
 
 # ============================================================================
@@ -102,15 +117,35 @@ class BaseAgent:
 class DataCollectorAgent(BaseAgent):
     """Collects and validates market data from Polymarket"""
     
-    def __init__(self):
+    def __init__(self, cache_ttl: float = 30.0):
         super().__init__("Data Collector")
+        self.cache_ttl = cache_ttl
+        # market_query -> (time.monotonic() of the fetch, market data); callers treat the dict as read-only
+        self._cache: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+        # market_query -> browser session in progress, shared by concurrent callers
+        self._inflight: Dict[str, asyncio.Task] = {}
     
     async def collect_market_data(self, market_query: str) -> Dict[str, Any]:
-        """Collect fresh market data"""
-        import sys
-        import os
-        sys.path.insert(0, os.path.join(os.path.dirname(__file__), "Polymarket Agent"))
+        """
+        Collect fresh market data.
         
+        Data younger than cache_ttl seconds is reused, and concurrent requests for the
+        same query wait on a single browser session instead of starting their own.
+        """
+        cached = self._cache.get(market_query)
+        if cached is not None and time.monotonic() - cached[0] < self.cache_ttl:
+            return cached[1]
+        
+        task = self._inflight.get(market_query)
+        if task is None:
+            task = asyncio.ensure_future(self._fetch_market_data(market_query))
+            self._inflight[market_query] = task
+            task.add_done_callback(lambda _: self._inflight.pop(market_query, None))
+        # Shielded so one cancelled caller doesn't cancel the fetch for the others
+        return await asyncio.shield(task)
+    
+    async def _fetch_market_data(self, market_query: str) -> Dict[str, Any]:
+        # Imported lazily: pulls in browser_use, which most callers of this module never need
         from polymarket_collector import collect_market_data
         
         market_data = await collect_market_data(
@@ -119,7 +154,14 @@ class DataCollectorAgent(BaseAgent):
             headless=True
         )
         
-        return market_data.dict()
+        data = market_data.model_dump()
+        now = time.monotonic()
+        self._cache = {
+            query: entry for query, entry in self._cache.items()
+            if now - entry[0] < self.cache_ttl
+        }
+        self._cache[market_query] = (now, data)
+        return data
     
     async def analyze(self, market_data: Dict[str, Any]) -> AgentDecision:
         """Validate data quality and check for anomalies"""
@@ -247,7 +289,6 @@ Return a summary of what you found and whether it supports a YES or NO outcome."
             
         except Exception as e:
             # Even on failure, make a guess based on market title
-            import random
             recommendation = random.choice(["YES", "NO"])
             return AgentDecision(
                 agent_name=self.name,
@@ -404,7 +445,6 @@ Summarize the overall sentiment."""
             
         except Exception as e:
             # Even on error, make a random but confident call
-            import random
             recommendation = random.choice(["YES", "NO"])
             return AgentDecision(
                 agent_name=self.name,
@@ -423,8 +463,9 @@ class DecisionCoordinator:
     """Coordinates all agents and makes final decision"""
     
     def __init__(self):
+        self.data_collector = DataCollectorAgent()
         self.agents = [
-            DataCollectorAgent(),
+            self.data_collector,
             OddsAnalyzer(),
             # ResearchAgent(),  # Can be slow, comment out for faster results
             # SentimentAgent(),  # Can be slow, comment out for faster results
@@ -444,10 +485,9 @@ class DecisionCoordinator:
         print(f"🤖 Starting multi-agent analysis for: {market_query}")
         print("=" * 70)
         
-        # Step 1: Collect market data
-        data_collector = DataCollectorAgent()
+        # Step 1: Collect market data (once; every agent analyzes the same snapshot)
         print("\n📊 Collecting market data...")
-        market_data = await data_collector.collect_market_data(market_query)
+        market_data = await self.data_collector.collect_market_data(market_query)
         print(f"✓ Market: {market_data.get('market_title')}")
         
         # Step 2: Run all agents in parallel
@@ -540,14 +580,15 @@ class DecisionCoordinator:
                     suggested_bet_size = (edge / 2) * 100  # as percentage
                     suggested_bet_size = min(suggested_bet_size, 20)  # cap at 20%
                 else:
-                    suggested_bet_size = 0
+                    suggested_bet_size = 0.0
                     final_recommendation = "SKIP"
             else:
-                suggested_bet_size = 0
+                suggested_bet_size = 0.0
         else:
-            suggested_bet_size = 0
+            suggested_bet_size = 0.0
         
-        return CollectiveDecision(
+        # Built from already-validated agent decisions and bounded aggregates: skip revalidation
+        return CollectiveDecision.model_construct(
             market_title=market_data.get('market_title', ''),
             market_url=market_data.get('market_url', ''),
             agent_decisions=agent_decisions,
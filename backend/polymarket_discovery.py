@@ -7,13 +7,18 @@ This agent uses browser-use to:
 2. Find trending/active markets
 3. Extract market data
 4. Feed it to the multi-agent decision system
+
+fetch_gamma_markets() lists active markets straight from Polymarket's Gamma
+REST API instead, without starting a browser.
 """
 
 import asyncio
 import json
 import os
+import traceback
 from typing import List, Dict, Optional
 from datetime import datetime
+import httpx
 from dotenv import load_dotenv
 from pydantic import BaseModel, Field
 
@@ -31,6 +36,62 @@ class PolymarketMarket(BaseModel):
     volume: Optional[str] = None
     liquidity: Optional[str] = None
     category: Optional[str] = None
+    token_id: Optional[str] = Field(default=None, description="CLOB token id of the YES outcome (Gamma API markets only)")
+
+
+GAMMA_MARKETS_URL = "https://gamma-api.polymarket.com/markets"
+
+
+def _gamma_market(market: Dict) -> Optional[PolymarketMarket]:
+    """Convert one Gamma API market to a PolymarketMarket, or None if it isn't a priced binary market."""
+    try:
+        # Gamma encodes these lists as JSON strings, e.g. '["0.16", "0.84"]'
+        prices = json.loads(market.get("outcomePrices") or "[]")
+        if len(prices) != 2:
+            return None
+        tokens = json.loads(market.get("clobTokenIds") or "[]")
+        volume = market.get("volumeNum")
+        liquidity = market.get("liquidityNum")
+        return PolymarketMarket(
+            title=market["question"],
+            url=f"https://polymarket.com/market/{market['slug']}" if market.get("slug") else None,
+            yes_price=float(prices[0]),
+            no_price=float(prices[1]),
+            volume=f"${volume:,.0f}" if volume is not None else None,
+            liquidity=f"${liquidity:,.0f}" if liquidity is not None else None,
+            category=market.get("category"),
+            token_id=tokens[0] if tokens else None,
+        )
+    except (KeyError, TypeError, ValueError):
+        return None
+
+
+async def fetch_gamma_markets(client: httpx.AsyncClient, limit: int = 10) -> List[PolymarketMarket]:
+    """
+    List the highest-volume active binary markets from the Gamma API.
+    
+    Args:
+        client: Shared HTTP client (keeps the connection alive between cycles)
+        limit: Maximum number of markets to request
+        
+    Returns:
+        Discovered markets, highest 24h volume first
+    
+    Raises:
+        httpx.HTTPError: If the request fails
+    """
+    response = await client.get(
+        GAMMA_MARKETS_URL,
+        params={
+            "active": "true",
+            "closed": "false",
+            "limit": limit,
+            "order": "volume24hr",
+            "ascending": "false",
+        },
+    )
+    response.raise_for_status()
+    return [m for m in map(_gamma_market, response.json()) if m is not None]
 
 
 class PolymarketDiscovery:
@@ -132,7 +193,6 @@ Only return markets that are currently active (not resolved).
                 
         except Exception as e:
             print(f"❌ Error discovering markets: {e}")
-            import traceback
             traceback.print_exc()
             return []
         finally:
@@ -221,7 +281,6 @@ Return as JSON with this structure:
                 
         except Exception as e:
             print(f"❌ Error getting market data: {e}")
-            import traceback
             traceback.print_exc()
             return None
         finally:
@@ -310,7 +369,6 @@ Sort by relevance to the query "{query}".
                 
         except Exception as e:
             print(f"❌ Error searching markets: {e}")
-            import traceback
             traceback.print_exc()
             return []
         finally:
@@ -0,0 +1,68 @@
+"""
+Tests for the Flask API server's cached listings and their ETag/304 responses.
+"""
+
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+backend_dir = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(backend_dir))
+sys.path.insert(0, str(backend_dir / 'Polymarket Agent'))
+
+import api_server
+
+
+def market(market_id: str) -> dict:
+	return {'market_id': market_id, 'market_title': f'Market {market_id}', 'market_category': 'Politics'}
+
+
+@pytest.fixture
+def markets_file(tmp_path, monkeypatch):
+	path = tmp_path / 'polymarket_data.jsonl'
+	path.write_text(json.dumps(market('a')) + '\n', encoding='utf-8')
+	monkeypatch.setattr(api_server, 'MARKETS_FILE', str(path))
+	return path
+
+
+@pytest.fixture
+def client():
+	return api_server.app.test_client()
+
+
+def test_markets_etag_round_trip(client, markets_file):
+	"""An unchanged file answers a matching If-None-Match with 304 and no body."""
+	first = client.get('/api/markets')
+	assert first.status_code == 200
+	assert first.get_json()['count'] == 1
+	etag = first.headers['ETag']
+
+	again = client.get('/api/markets', headers={'If-None-Match': etag})
+	assert again.status_code == 304
+	assert again.headers['ETag'] == etag
+	assert again.data == b''
+
+
+def test_markets_etag_changes_with_file(client, markets_file):
+	"""Appending a record changes the ETag, so the old tag gets the new listing."""
+	etag = client.get('/api/markets').headers['ETag']
+	with markets_file.open('a', encoding='utf-8') as f:
+		f.write(json.dumps(market('b')) + '\n')
+
+	response = client.get('/api/markets', headers={'If-None-Match': etag})
+
+	assert response.status_code == 200
+	assert response.get_json()['count'] == 2
+	assert response.headers['ETag'] != etag
+
+
+def test_markets_etag_depends_on_query(client, markets_file):
+	"""The same file listed with different query parameters gets a different tag."""
+	etag = client.get('/api/markets').headers['ETag']
+
+	response = client.get('/api/markets?limit=1', headers={'If-None-Match': etag})
+
+	assert response.status_code == 200
+	assert response.headers['ETag'] != etag
@@ -0,0 +1,103 @@
+"""
+Tests for the one-time migration of the legacy list-JSON trade history to JSON Lines.
+"""
+
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from autonomous_trading_agent import AutonomousTradingAgent, load_trade_history, migrate_trade_history
+
+
+def trade_dict(trade_id: str) -> dict:
+	return {
+		'trade_id': trade_id,
+		'market_id': f'market-{trade_id}',
+		'market_title': f'Market {trade_id}',
+		'action': 'buy',
+		'outcome': 'Yes',
+		'price': 0.5,
+		'size': 100.0,
+		'shares': 200.0,
+		'confidence': 0.8,
+		'consensus': 0.75,
+		'agent_votes': {'odds_analyzer': 'YES'},
+		'executed_at': '2026-01-01T00:00:00',
+	}
+
+
+def test_migrates_legacy_list(tmp_path):
+	"""Each trade in the legacy list becomes one line, in order; the legacy file is kept."""
+	legacy = tmp_path / 'trades_history.json'
+	history = tmp_path / 'trades_history.jsonl'
+	legacy.write_text(json.dumps([trade_dict('a'), trade_dict('b')], indent=2), encoding='utf-8')
+
+	assert migrate_trade_history(legacy, history) == 2
+
+	assert [trade.trade_id for trade in load_trade_history(history)] == ['a', 'b']
+	assert len(history.read_text(encoding='utf-8').splitlines()) == 2
+	assert legacy.exists()
+	assert not history.with_suffix('.jsonl.tmp').exists()
+
+
+def test_migrates_empty_file(tmp_path):
+	"""An empty legacy file migrates as an empty history."""
+	legacy = tmp_path / 'trades_history.json'
+	history = tmp_path / 'trades_history.jsonl'
+	legacy.write_text('', encoding='utf-8')
+
+	assert migrate_trade_history(legacy, history) == 0
+
+	assert history.read_text(encoding='utf-8') == ''
+
+
+def test_malformed_entry_writes_nothing(tmp_path):
+	"""A malformed trade raises before any file is written."""
+	legacy = tmp_path / 'trades_history.json'
+	history = tmp_path / 'trades_history.jsonl'
+	broken = trade_dict('b')
+	del broken['price']
+	legacy.write_text(json.dumps([trade_dict('a'), broken]), encoding='utf-8')
+
+	with pytest.raises(ValueError):
+		migrate_trade_history(legacy, history)
+
+	assert not history.exists()
+	assert not history.with_suffix('.jsonl.tmp').exists()
+
+
+def test_agent_leaves_existing_history_untouched(tmp_path):
+	"""The agent only migrates when there is no JSON Lines history yet."""
+	legacy = tmp_path / 'trades_history.json'
+	history = tmp_path / 'trades_history.jsonl'
+	legacy.write_text(json.dumps([trade_dict('legacy')]), encoding='utf-8')
+	existing = json.dumps(trade_dict('current')) + '\n'
+	history.write_text(existing, encoding='utf-8')
+
+	AutonomousTradingAgent(
+		markets_to_monitor=[],
+		portfolio_path=str(tmp_path / 'portfolio.json'),
+		trades_history_path=str(history),
+	)
+
+	assert history.read_text(encoding='utf-8') == existing
+
+
+def test_agent_migrates_on_startup(tmp_path):
+	"""With only the legacy file present, constructing the agent migrates it."""
+	legacy = tmp_path / 'trades_history.json'
+	history = tmp_path / 'trades_history.jsonl'
+	legacy.write_text(json.dumps([trade_dict('a')]), encoding='utf-8')
+
+	AutonomousTradingAgent(
+		markets_to_monitor=[],
+		portfolio_path=str(tmp_path / 'portfolio.json'),
+		trades_history_path=str(history),
+	)
+
+	assert [trade.trade_id for trade in load_trade_history(history)] == ['a']
+	assert legacy.exists()
@@ -0,0 +1,166 @@
+"""
+Tests for the autonomous trading agent's Portfolio bookkeeping.
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from autonomous_trading_agent import AutonomousTradingAgent, Portfolio, TradeExecution, _construct_portfolio
+
+
+def make_trade(trade_id: str, size: float = 100.0, action: str = 'buy', outcome: str = 'Yes', price: float = 0.5) -> TradeExecution:
+	return TradeExecution(
+		trade_id=trade_id,
+		market_id=f'market-{trade_id}',
+		market_title=f'Market {trade_id}',
+		action=action,
+		outcome=outcome,
+		price=price,
+		size=size,
+		shares=size / price,
+		confidence=0.8,
+		consensus=0.75,
+		agent_votes={'odds_analyzer': 'YES'},
+		executed_at='2026-01-01T00:00:00',
+	)
+
+
+def assert_indexes_consistent(portfolio: Portfolio):
+	"""The private indexes must describe active_positions exactly."""
+	ids = [trade.trade_id for trade in portfolio.active_positions]
+	assert portfolio._position_index == {trade_id: i for i, trade_id in enumerate(ids)}
+	assert portfolio._active_by_id == {trade.trade_id: trade for trade in portfolio.active_positions}
+	assert portfolio._open_cost == round(sum(trade.size for trade in portfolio.active_positions), 2)
+
+
+def test_open_and_close_middle_swaps_last_into_slot():
+	"""Closing a middle position moves the last position into its slot."""
+	portfolio = Portfolio()
+	for trade_id, size in (('a', 100.0), ('b', 50.0), ('c', 25.0)):
+		portfolio.add_trade(make_trade(trade_id, size=size))
+	assert_indexes_consistent(portfolio)
+	assert portfolio.cash == 9825.0
+
+	portfolio.close_trade('b', 1.0, 'Yes')
+
+	assert [trade.trade_id for trade in portfolio.active_positions] == ['a', 'c']
+	assert_indexes_consistent(portfolio)
+	assert [trade.trade_id for trade in portfolio.closed_positions] == ['b']
+	assert portfolio.closed_positions[0].status == 'closed'
+
+
+def test_close_last_and_unknown_trade():
+	"""Closing the last position pops it; closing an unknown id changes nothing."""
+	portfolio = Portfolio()
+	portfolio.add_trade(make_trade('a', size=100.0))
+	portfolio.add_trade(make_trade('b', size=50.0))
+
+	portfolio.close_trade('b', 0.0, 'No')
+	assert [trade.trade_id for trade in portfolio.active_positions] == ['a']
+	assert_indexes_consistent(portfolio)
+
+	portfolio.close_trade('b', 0.0, 'No')
+	assert len(portfolio.closed_positions) == 1
+
+	portfolio.close_trade('a', 0.0, 'No')
+	assert portfolio.active_positions == []
+	assert_indexes_consistent(portfolio)
+	assert portfolio.get_position_value() == 0.0
+
+
+def test_settle_batch_keeps_open_cost_in_step():
+	"""settle_batch closes the listed trades and the open cost matches what is left."""
+	portfolio = Portfolio()
+	for i in range(6):
+		portfolio.add_trade(make_trade(f't{i}', size=10.0 + i))
+
+	batch_pnl = portfolio.settle_batch(['t1', 't4', 'missing'], ['Yes', 'No', 'Yes'], [1.0, 0.0, 1.0])
+
+	assert [trade.trade_id for trade in portfolio.active_positions] == ['t0', 't2', 't3', 't5']
+	assert_indexes_consistent(portfolio)
+	assert portfolio.get_position_value() == 10.0 + 12.0 + 13.0 + 15.0
+	# t1 bought Yes at 0.5 and won (1 - 0.5) * 22 shares; t4 lost its 14.0 stake
+	assert batch_pnl == 11.0 - 14.0
+	assert portfolio.total_pnl == batch_pnl
+	assert portfolio.winning_trades == 1
+
+
+def test_trusted_load_rebuilds_indexes():
+	"""A portfolio rebuilt with model_construct gets the same indexes as a validated one."""
+	portfolio = Portfolio()
+	for trade_id in ('a', 'b', 'c'):
+		portfolio.add_trade(make_trade(trade_id))
+	portfolio.close_trade('a', 1.0, 'Yes')
+
+	loaded = _construct_portfolio(portfolio.model_dump())
+
+	assert [trade.trade_id for trade in loaded.active_positions] == ['c', 'b']
+	assert_indexes_consistent(loaded)
+	loaded.close_trade('b', 0.0, 'No')
+	assert [trade.trade_id for trade in loaded.active_positions] == ['c']
+	assert_indexes_consistent(loaded)
+
+
+@pytest.mark.parametrize('strict_load', [False, True])
+async def test_save_and_load_round_trip(tmp_path, strict_load):
+	"""A saved portfolio loads back identical, through either the trusted or the validated path."""
+	paths = {
+		'portfolio_path': str(tmp_path / 'portfolio.json'),
+		'trades_history_path': str(tmp_path / 'trades_history.jsonl'),
+	}
+	agent = AutonomousTradingAgent(markets_to_monitor=[], **paths)
+	for trade_id in ('a', 'b', 'c'):
+		agent.portfolio.add_trade(make_trade(trade_id))
+	agent.portfolio.close_trade('b', 1.0, 'Yes')
+	await agent._save_portfolio()
+
+	reloaded = AutonomousTradingAgent(markets_to_monitor=[], strict_load=strict_load, **paths)
+
+	assert reloaded.portfolio.model_dump() == agent.portfolio.model_dump()
+	assert_indexes_consistent(reloaded.portfolio)
+	assert not (tmp_path / 'portfolio.json.tmp').exists()
+
+
+def test_closed_stats_empty_portfolio():
+	"""No closed trades: every statistic is zero and nothing divides by zero."""
+	stats = Portfolio().aggregate_stats()
+
+	assert stats == {'count': 0, 'realized_pnl': 0.0, 'win_rate': 0.0, 'mean_pnl': 0.0, 'mean_size': 0.0}
+
+
+def test_closed_stats_mixed_wins_and_losses():
+	"""Wins and losses sum into realized PnL and the means are per closed trade."""
+	portfolio = Portfolio()
+	portfolio.add_trade(make_trade('win', size=100.0, price=0.5))
+	portfolio.add_trade(make_trade('loss', size=50.0, price=0.5))
+	portfolio.close_trade('win', 1.0, 'Yes')  # (1 - 0.5) * 200 shares = +100
+	portfolio.close_trade('loss', 0.0, 'No')  # -50
+
+	stats = portfolio.aggregate_stats()
+
+	assert stats['count'] == 2
+	assert stats['realized_pnl'] == 50.0
+	assert stats['mean_pnl'] == 25.0
+	assert stats['mean_size'] == 75.0
+	assert stats['win_rate'] == 0.5
+
+
+def test_closed_stats_win_rate_convention():
+	"""win_rate counts only closed trades, and a break-even trade is not a win."""
+	portfolio = Portfolio()
+	portfolio.add_trade(make_trade('win', price=0.5))
+	portfolio.add_trade(make_trade('even', price=1.0))
+	portfolio.add_trade(make_trade('open'))
+	portfolio.close_trade('win', 1.0, 'Yes')
+	portfolio.close_trade('even', 1.0, 'Yes')  # (1 - 1.0) * shares = 0
+
+	stats = portfolio.aggregate_stats()
+
+	assert stats['count'] == 2
+	assert stats['win_rate'] == 0.5
+	# The portfolio-wide rate divides by every trade, open ones included
+	assert portfolio.win_rate == 1 / 3